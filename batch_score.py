@@ -0,0 +1,148 @@
+"""Score whole cohorts in the Student_Performance.csv schema.
+
+Usage:
+    python batch_score.py cohort.csv scored.csv --chunksize 200000
+    python batch_score.py cohort.parquet scored.parquet
+    python batch_score.py regional_export.csv scored.parquet --cache
+
+Input is streamed in fixed-size chunks, so memory use stays bounded by the
+chunk size no matter how large the file is. With --cache the input is read
+through the memory-mapped columnar cache (see dataset.py), which skips text
+parsing on every run after the first; only the schema columns are kept.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from model_artifact import load_predictor
+from predictor import EXTRACURRICULAR_MAP, FEATURE_COLS, PERFORMANCE_LEVELS, performance_level_code
+
+DEFAULT_CHUNKSIZE = 100_000
+OUTPUT_COLS = ['Predicted Score', 'Performance Level', 'Delta vs Previous Scores']
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield DataFrame chunks from a CSV or Parquet file."""
+    if _is_parquet(path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet requires pyarrow: pip install pyarrow")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def encode_features(chunk):
+    """(N, 5) float array in FEATURE_COLS order with Yes/No mapped to 1/0."""
+    missing = [col for col in FEATURE_COLS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Input is missing required columns: {missing}")
+
+    X = np.empty((len(chunk), len(FEATURE_COLS)), dtype=np.float64)
+    for j, col in enumerate(FEATURE_COLS):
+        values = chunk[col]
+        # object or, under pandas' string dtype, str columns of 'Yes'/'No'
+        if col == 'Extracurricular Activities' and not pd.api.types.is_numeric_dtype(values):
+            values = values.map(EXTRACURRICULAR_MAP)
+            if values.isna().any():
+                raise ValueError("'Extracurricular Activities' must be 'Yes' or 'No'")
+        X[:, j] = values.to_numpy(dtype=np.float64)
+    return X
+
+
+def score_chunk(predictor, chunk):
+    X = encode_features(chunk)
+    scores = predictor.predict(X)
+    out = chunk.copy()
+    out['Predicted Score'] = scores
+    out['Performance Level'] = np.asarray(PERFORMANCE_LEVELS, dtype=object)[performance_level_code(scores)]
+    out['Delta vs Previous Scores'] = scores - X[:, 1]
+    return out
+
+
+class _ChunkWriter:
+    """Appends scored chunks to a CSV or Parquet output file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet = _is_parquet(path)
+        self._writer = None
+        self._header = True
+
+    def write(self, frame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='w' if self._header else 'a', header=self._header, index=False)
+            self._header = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def score_file(input_path, output_path, chunksize=DEFAULT_CHUNKSIZE, predictor=None,
+               model_path='linear_regression_model.pkl', scaler_path='scaler.pkl', use_cache=False):
+    """Stream input_path through the model and write predictions to output_path.
+
+    Returns a dict with the row count, elapsed seconds and rows/sec.
+    """
+    if predictor is None:
+        predictor = load_predictor(model_path, scaler_path)
+
+    writer = _ChunkWriter(output_path)
+    rows = 0
+    start = time.perf_counter()
+    if use_cache:
+        from dataset import load_dataset
+        chunks = load_dataset(input_path, chunksize=chunksize).iter_frames(chunksize)
+    else:
+        chunks = iter_chunks(input_path, chunksize)
+    try:
+        for chunk in chunks:
+            writer.write(score_chunk(predictor, chunk))
+            rows += len(chunk)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_sec': rows / elapsed if elapsed > 0 else float('inf'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-score a student cohort file.")
+    parser.add_argument('input', help="CSV or Parquet file in the Student_Performance.csv schema")
+    parser.add_argument('output', help="Destination CSV or Parquet file")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    parser.add_argument('--model', default='linear_regression_model.pkl', help="Model pickle or .json artifact")
+    parser.add_argument('--scaler', default='scaler.pkl')
+    parser.add_argument('--cache', action='store_true',
+                        help="Read the input through the memory-mapped columnar cache (built on first use)")
+    args = parser.parse_args(argv)
+
+    stats = score_file(args.input, args.output, args.chunksize,
+                       model_path=args.model, scaler_path=args.scaler, use_cache=args.cache)
+    print(f"Scored {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_sec']:,.0f} rows/sec) -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+"""Reproducible performance benchmarks.
+
+Usage:
+    python benchmark.py                              # full suite, appends to benchmark_history.json
+    python benchmark.py --sizes 1000000 --skip-training
+    python benchmark.py --fail-on-regression --threshold 0.2
+
+Covers single-row and batch prediction (the original DataFrame +
+scaler.transform + model.predict path and the compiled predictor, for the
+linear model and for the notebook's tree, forest and k-NN candidates),
+StudyAdvisor and what-if sweep throughput, Plotly figure build/render time and training
+of the notebook's seven candidate models. Batch sizes beyond the dataset
+are synthetic cohorts upsampled from Student_Performance.csv with a fixed
+seed. Each run is appended to a JSON history and compared with the
+latest run from the same host and CPU count. A metric more than
+--threshold worse is reported as a regression, unless the timing moved by
+less than a small absolute floor (noise on microsecond-scale metrics).
+"""
+import argparse
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from batch_score import encode_features
+from predictor import FEATURE_COLS, NUMERICAL_COLS, CompiledPredictor
+from study_advisor import StudyAdvisor
+
+DEFAULT_HISTORY = 'benchmark_history.json'
+DEFAULT_SIZES = (1_000_000, 10_000_000)
+CHUNK_ROWS = 1_000_000
+# Timing changes smaller than this are noise, whatever the relative change
+ABSOLUTE_FLOORS = {'us': 1.0, 'ms': 0.05, 's': 0.01}
+
+
+def _result(value, unit, higher_is_better):
+    return {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+
+
+def best_of(fn, repeat=5, number=1):
+    """Best wall time of `repeat` runs of `number` calls, per call in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def load_dataset(path='Student_Performance.csv'):
+    df = pd.read_csv(path)
+    return encode_features(df), df
+
+
+def synthetic_chunks(X, n_rows, seed=0, chunk_rows=CHUNK_ROWS):
+    """Yield row-resampled chunks of X totalling n_rows, deterministically."""
+    rng = np.random.default_rng(seed)
+    remaining = n_rows
+    while remaining > 0:
+        size = min(chunk_rows, remaining)
+        yield X[rng.integers(0, len(X), size)]
+        remaining -= size
+
+
+def _sklearn_predict(model, scaler, X):
+    # The dashboard's original inference path
+    input_df = pd.DataFrame(X, columns=FEATURE_COLS)
+    input_scaled = input_df.copy()
+    input_scaled[NUMERICAL_COLS] = scaler.transform(input_df[NUMERICAL_COLS])
+    return model.predict(input_scaled)
+
+
+def bench_prediction(model, scaler, X, sizes):
+    predictor = CompiledPredictor.from_sklearn(model, scaler)
+    row = X[0]
+    results = {
+        'predict_single_sklearn_us': _result(best_of(lambda: _sklearn_predict(model, scaler, row[None, :]), number=200) * 1e6, 'us', False),
+        'predict_single_compiled_us': _result(best_of(lambda: predictor.predict_one(*row), number=20000) * 1e6, 'us', False),
+    }
+    for n_rows in sizes:
+        timings = {'sklearn': 0.0, 'compiled': 0.0}
+        for chunk in synthetic_chunks(X, n_rows):
+            start = time.perf_counter()
+            _sklearn_predict(model, scaler, chunk)
+            timings['sklearn'] += time.perf_counter() - start
+            start = time.perf_counter()
+            predictor.predict(chunk)
+            timings['compiled'] += time.perf_counter() - start
+        for path, seconds in timings.items():
+            results[f'predict_batch_{path}_{n_rows}_rows_per_sec'] = _result(n_rows / seconds, 'rows/s', True)
+    return results
+
+
+def bench_models(df, X, n_rows=100_000, names=("Decision Tree", "Random Forest Regressor", "K-Neighbors Regressor")):
+    """Compile time, single-row latency and batch throughput of the non-linear candidates."""
+    from model_artifact import compile_model
+    from train import make_models, prepare_data
+
+    arrays, scaler = prepare_data(df)
+    models = make_models()
+    cohort = next(synthetic_chunks(X, n_rows, seed=1))
+    row = X[0]
+    results = {}
+    for name in names:
+        # Fitted with feature names like train.py, so the sklearn path is not timing name-mismatch warnings
+        model = models[name].fit(pd.DataFrame(arrays['X_train'], columns=FEATURE_COLS), arrays['y_train'])
+        key = name.lower().replace(' ', '_').replace('-', '_')
+        start = time.perf_counter()
+        predictor = compile_model(model, scaler)
+        results[f'compile_{key}_s'] = _result(time.perf_counter() - start, 's', False)
+        results[f'predict_single_{key}_sklearn_us'] = _result(
+            best_of(lambda: _sklearn_predict(model, scaler, row[None, :]), number=20) * 1e6, 'us', False)
+        results[f'predict_single_{key}_compiled_us'] = _result(
+            best_of(lambda: predictor.predict_one(*row), number=20000) * 1e6, 'us', False)
+        results[f'predict_batch_{key}_sklearn_rows_per_sec'] = _result(
+            n_rows / best_of(lambda: _sklearn_predict(model, scaler, cohort), repeat=3), 'rows/s', True)
+        results[f'predict_batch_{key}_compiled_rows_per_sec'] = _result(
+            n_rows / best_of(lambda: predictor.predict(cohort), repeat=3), 'rows/s', True)
+    return results
+
+
+def bench_advice(X, predictor, n_students=10_000):
+    X = X[:n_students]
+    scores = predictor.predict(X)
+    rows = [tuple(r) + (s,) for r, s in zip(X.tolist(), scores.tolist())]
+
+    def per_student():
+        for r in rows:
+            StudyAdvisor.get_study_recommendations(*r)
+
+    loop = best_of(per_student, repeat=3)
+    batch = best_of(lambda: StudyAdvisor.get_batch_recommendations(*X.T, scores), repeat=3)
+    return {
+        'advice_per_student_per_sec': _result(len(rows) / loop, 'students/s', True),
+        'advice_batch_per_sec': _result(len(rows) / batch, 'students/s', True),
+    }
+
+
+def bench_what_if(X, predictor, n_students=10_000):
+    from what_if import sweep, sweep_batch
+
+    row = X[0]
+    single = best_of(lambda: sweep(predictor, *row), number=200)
+    batch = best_of(lambda: sweep_batch(predictor, X[:n_students]), repeat=3)
+    return {
+        'what_if_single_ms': _result(single * 1000, 'ms', False),
+        'what_if_batch_per_sec': _result(min(n_students, len(X)) / batch, 'students/s', True),
+    }
+
+
+def bench_charts():
+    from dashboard_charts import timing_breakdown
+
+    results = {}
+    for chart, row in timing_breakdown(repeat=50).items():
+        for key, value in row.items():
+            results[f'chart_{chart}_{key}'] = _result(value, 'ms', False)
+    return results
+
+
+def bench_training(df, jobs=None):
+    from train import select_model
+
+    start = time.perf_counter()
+    report, _, _ = select_model(df, folds=1, jobs=jobs)
+    results = {'train_all_models_wall_s': _result(time.perf_counter() - start, 's', False)}
+    for name, entry in report['models'].items():
+        key = name.lower().replace(' ', '_').replace('-', '_')
+        results[f'train_{key}_s'] = _result(entry['total_seconds'], 's', False)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_environment():
+    """What a run's numbers depend on; runs are only compared when these match."""
+    return {'host': platform.node(), 'machine': platform.machine(), 'cpus': os.cpu_count()}
+
+
+def previous_run(history, environment):
+    """Latest history entry recorded in the same environment, or None."""
+    for entry in reversed(history):
+        if all(entry.get(key) == value for key, value in environment.items()):
+            return entry
+    return None
+
+
+def compare(current, previous, threshold):
+    """Metrics that got worse than `previous` by more than `threshold` (a fraction)."""
+    regressions = []
+    for name, result in current.items():
+        before = previous.get(name)
+        if not before or not before['value']:
+            continue
+        if result['higher_is_better']:
+            change = (before['value'] - result['value']) / before['value']
+        else:
+            change = (result['value'] - before['value']) / before['value']
+        floor = ABSOLUTE_FLOORS.get(result['unit'])
+        if floor is not None and abs(result['value'] - before['value']) < floor:
+            continue
+        if change > threshold:
+            regressions.append((name, before['value'], result['value'], change))
+    return regressions
+
+
+def run_suite(data_path='Student_Performance.csv', sizes=DEFAULT_SIZES, skip_training=False, jobs=None,
+              skip_models=False, model_path='linear_regression_model.pkl', scaler_path='scaler.pkl'):
+    with open(model_path, 'rb') as file:
+        model = pickle.load(file)
+    with open(scaler_path, 'rb') as file:
+        scaler = pickle.load(file)
+    X, df = load_dataset(data_path)
+
+    results = {}
+    stages = [
+        ('prediction', lambda: bench_prediction(model, scaler, X, sizes)),
+        ('advice', lambda: bench_advice(X, CompiledPredictor.from_sklearn(model, scaler))),
+        ('what_if', lambda: bench_what_if(X, CompiledPredictor.from_sklearn(model, scaler))),
+        ('charts', bench_charts),
+    ]
+    if not skip_models:
+        stages.append(('models', lambda: bench_models(df, X)))
+    if not skip_training:
+        stages.append(('training', lambda: bench_training(df, jobs)))
+    for name, stage in stages:
+        print(f"Running {name} benchmarks...", file=sys.stderr)
+        results.update(stage())
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the performance benchmark suite.")
+    parser.add_argument('--data', default='Student_Performance.csv')
+    parser.add_argument('--sizes', type=int, nargs='*', default=list(DEFAULT_SIZES),
+                        help="Synthetic cohort sizes for batch prediction")
+    parser.add_argument('--skip-training', action='store_true')
+    parser.add_argument('--skip-models', action='store_true', help="Skip the tree/forest/k-NN prediction benchmarks")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes for the training benchmark")
+    parser.add_argument('--history', default=DEFAULT_HISTORY)
+    parser.add_argument('--no-save', action='store_true', help="Do not append this run to the history")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Regression threshold as a fraction")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.data, args.sizes, args.skip_training, args.jobs, args.skip_models)
+
+    history = []
+    if os.path.exists(args.history):
+        with open(args.history) as file:
+            history = json.load(file)
+
+    print(f"\n{'Metric':<58}{'Value':>16}  Unit")
+    for name, result in results.items():
+        print(f"{name:<58}{result['value']:>16,.3f}  {result['unit']}")
+
+    environment = run_environment()
+    previous = previous_run(history, environment)
+    regressions = compare(results, previous['results'], args.threshold) if previous else []
+    if previous:
+        print(f"\nCompared with {previous.get('commit') or 'previous run'} ({previous['timestamp']}):")
+        for name, before, after, change in regressions:
+            print(f"  REGRESSION {name}: {before:,.3f} -> {after:,.3f} ({change:+.0%} worse)")
+        if not regressions:
+            print(f"  no regressions beyond {args.threshold:.0%}")
+    elif history:
+        print(f"\nNo earlier run on {environment['host']} with {environment['cpus']} CPUs to compare with")
+
+    if not args.no_save:
+        history.append({
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            **environment,
+            'results': results,
+        })
+        with open(args.history, 'w') as file:
+            json.dump(history, file, indent=2)
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
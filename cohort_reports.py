@@ -0,0 +1,288 @@
+"""Printable per-student advice reports for a whole cohort.
+
+Usage:
+    python cohort_reports.py cohort.csv reports/ --jobs 8
+    python cohort_reports.py cohort.parquet reports/ --id-column "Student ID" --block-size 1000
+
+Writes reports/student_<id>.html for every student plus reports/index.html.
+IDs that repeat, or that map to the same file name once unsafe characters
+are replaced, get a __row<n> suffix (then __row<n>__2, ...), so no report
+overwrites another. Reports are created exclusively in a staging directory
+and moved into place at the end, so uniqueness costs no memory per student;
+which of two duplicate IDs keeps the plain name depends on render order.
+Each report has the prediction, sorted recommendations, insights,
+mentoring plan and the dashboard's radar and gauge charts. plotly.js and
+the chart templates are written once as shared assets (plotly.min.js,
+report_charts.js), so each report only carries its own numbers and the
+directory works offline.
+
+Students are rendered in blocks across a process pool. Each worker loads
+the model and compiles the HTML template once. At most two blocks per
+worker are in flight, so memory stays bounded whatever the cohort size.
+"""
+import argparse
+import html
+import itertools
+import json
+import os
+import re
+import shutil
+import string
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+from batch_score import DEFAULT_CHUNKSIZE, encode_features, iter_chunks
+from dashboard_charts import chart_templates, radar_values
+from model_artifact import load_predictor
+from predictor import PERFORMANCE_LEVELS, performance_level_code
+from study_advisor import StudyAdvisor
+
+DEFAULT_BLOCK_SIZE = 500
+DEFAULT_ID_COLUMN = 'Student ID'
+PLOTLY_JS_FILE = 'plotly.min.js'
+CHARTS_JS_FILE = 'report_charts.js'
+INDEX_FILE = 'index.html'
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Student Report - $student</title>
+<style>
+  body { font-family: Arial, sans-serif; color: black; max-width: 960px; margin: 24px auto; }
+  .metrics { display: flex; gap: 16px; margin: 16px 0; }
+  .metric { flex: 1; border: 1px solid #ccc; border-radius: 8px; padding: 12px; }
+  .metric .value { font-size: 24px; font-weight: bold; }
+  .charts { display: flex; }
+  .chart { width: 50%; height: 400px; }
+  .rec { border-left: 4px solid #f5576c; padding: 8px 12px; margin: 8px 0; page-break-inside: avoid; }
+  .insight { border-left: 4px solid #4facfe; padding: 8px 12px; margin: 8px 0; }
+  @media print { .chart { height: 320px; } }
+</style>
+<script src="$plotly_js"></script>
+<script src="$charts_js"></script>
+</head>
+<body>
+<h1>🎓 Student Performance Report</h1>
+<p>Student: <strong>$student</strong> &middot; Generated $generated</p>
+<div class="metrics">
+  <div class="metric">🎯 Predicted Score<div class="value">$prediction%</div>$delta vs previous</div>
+  <div class="metric">📊 Performance Level<div class="value">$level</div></div>
+  <div class="metric">📈 Previous Scores<div class="value">$previous%</div></div>
+</div>
+<p>Hours studied: $hours &middot; Sleep hours: $sleep &middot; Sample papers: $papers &middot; Extracurricular: $extracurricular</p>
+<div class="charts"><div id="radar" class="chart"></div><div id="gauge" class="chart"></div></div>
+<script>renderCharts($chart_values);</script>
+<h2>💡 Key Insights</h2>
+$insights
+<h2>🎯 Personalized Action Plan</h2>
+$recommendations
+<h2>👨‍🏫 Personalized Mentoring Plan</h2>
+$mentoring
+</body>
+</html>
+"""
+
+RECOMMENDATION_TEMPLATE = """<div class="rec"><strong>[$priority] $category - $message</strong>
+<p><em>Action:</em> $action</p><p><em>Expected impact:</em> $impact</p></div>"""
+
+CHARTS_JS = """// Shared by every report: fills the dashboard's chart templates with one student's values
+const REPORT_TEMPLATES = %s;
+function renderCharts(values) {
+  const radar = JSON.parse(JSON.stringify(REPORT_TEMPLATES.radar));
+  radar.data[0].r = values.radar;
+  const gauge = JSON.parse(JSON.stringify(REPORT_TEMPLATES.gauge));
+  gauge.data[0].value = values.gauge[0];
+  gauge.data[0].delta.reference = values.gauge[1];
+  Plotly.newPlot('radar', radar.data, radar.layout, {staticPlot: true});
+  Plotly.newPlot('gauge', gauge.data, gauge.layout, {staticPlot: true});
+}
+"""
+
+_WORKER = {}
+
+
+def write_assets(out_dir):
+    """plotly.js and the chart templates, written once per output directory."""
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs
+
+    with open(os.path.join(out_dir, PLOTLY_JS_FILE), 'w', encoding='utf-8') as file:
+        file.write(get_plotlyjs())
+    templates = chart_templates()
+    payload = '{"radar": %s, "gauge": %s}' % (pio.to_json(templates['radar'], validate=False),
+                                              pio.to_json(templates['gauge'], validate=False))
+    with open(os.path.join(out_dir, CHARTS_JS_FILE), 'w', encoding='utf-8') as file:
+        file.write(CHARTS_JS % payload)
+
+
+def report_filename(student_id):
+    return 'student_' + re.sub(r'[^A-Za-z0-9_.-]', '_', str(student_id)) + '.html'
+
+
+def _init_worker(model_path, scaler_path, out_dir):
+    _WORKER['predictor'] = load_predictor(model_path, scaler_path)
+    _WORKER['report'] = string.Template(REPORT_TEMPLATE)
+    _WORKER['recommendation'] = string.Template(RECOMMENDATION_TEMPLATE)
+    _WORKER['out_dir'] = out_dir
+    _WORKER['generated'] = datetime.now().strftime("%B %d, %Y at %H:%M")
+
+
+def render_report(student_id, row, score, level, recommendations, insights, mentoring_plan):
+    """HTML for one student; row is the encoded feature row in FEATURE_COLS order."""
+    hours, previous, extracurricular, sleep, papers = row.tolist()
+    escape = html.escape
+    chart_values = {
+        'radar': radar_values(hours, previous, papers, sleep, extracurricular),
+        'gauge': [score, previous],
+    }
+    recs = '\n'.join(_WORKER['recommendation'].substitute({k: escape(str(v)) for k, v in rec.items()})
+                     for rec in recommendations)
+    return _WORKER['report'].substitute(
+        student=escape(str(student_id)),
+        generated=_WORKER['generated'],
+        plotly_js=PLOTLY_JS_FILE,
+        charts_js=CHARTS_JS_FILE,
+        prediction=f"{score:.1f}",
+        delta=f"{score - previous:+.1f}",
+        level=level,
+        previous=f"{previous:g}",
+        hours=f"{hours:g}",
+        sleep=f"{sleep:g}",
+        papers=f"{papers:g}",
+        extracurricular='Yes' if extracurricular else 'No',
+        chart_values=json.dumps(chart_values),
+        insights='\n'.join(f'<div class="insight">{escape(i)}</div>' for i in insights) or '<p>None.</p>',
+        recommendations=recs or '<p>Keep up your current plan.</p>',
+        mentoring=('<ol>' + ''.join(f'<li>{escape(m)}</li>' for m in mentoring_plan) + '</ol>') if mentoring_plan
+        else '<p>Continue your excellent self-directed learning approach!</p>',
+    )
+
+
+def _create_report(student_id, row):
+    """(file name, renamed, open file) of a report file not yet written in this run."""
+    suffixed = (f"{student_id}__row{row}" + (f"__{k}" if k > 1 else '') for k in itertools.count(1))
+    for renamed, candidate in enumerate(itertools.chain([student_id], suffixed)):
+        filename = report_filename(candidate)
+        try:
+            return filename, renamed > 0, open(os.path.join(_WORKER['out_dir'], filename), 'x', encoding='utf-8')
+        except FileExistsError:
+            continue
+
+
+def _render_block(X, ids, first_row):
+    """Render and write one block of students; returns their index rows."""
+    scores = _WORKER['predictor'].predict(X)
+    levels = performance_level_code(scores)
+    advice = StudyAdvisor.get_batch_recommendations(*X.T, scores)
+    rows = []
+    for i, student_id in enumerate(ids):
+        recommendations, insights, mentoring_plan = advice.expand(i)
+        score, level = float(scores[i]), PERFORMANCE_LEVELS[int(levels[i])]
+        filename, renamed, file = _create_report(student_id, first_row + i)
+        with file:
+            file.write(render_report(student_id, X[i], score, level, recommendations, insights, mentoring_plan))
+        rows.append((filename, student_id, score, level, renamed))
+    return rows
+
+
+def _iter_blocks(input_path, chunksize, block_size, id_column):
+    start = 0
+    for chunk in iter_chunks(input_path, chunksize):
+        X = encode_features(chunk)
+        if id_column and id_column in chunk.columns:
+            ids = chunk[id_column].astype(str).tolist()
+        else:
+            ids = [f"{n:06d}" for n in range(start + 1, start + len(chunk) + 1)]
+        for offset in range(0, len(X), block_size):
+            yield X[offset:offset + block_size], ids[offset:offset + block_size], start + offset + 1
+        start += len(chunk)
+
+
+def generate_reports(input_path, out_dir, jobs=None, block_size=DEFAULT_BLOCK_SIZE, chunksize=DEFAULT_CHUNKSIZE,
+                     id_column=DEFAULT_ID_COLUMN, model_path='linear_regression_model.pkl', scaler_path='scaler.pkl'):
+    """Write one HTML report per student of input_path into out_dir.
+
+    id_column names the student column used for file names; rows are
+    numbered when the input has no such column. Returns a dict with the
+    report count, the number of report files written, how many reports
+    were renamed to avoid a file name clash, elapsed seconds and reports/sec.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    write_assets(out_dir)
+    jobs = jobs or os.cpu_count() or 1
+    max_in_flight = 2 * jobs
+    count = files = renamed = 0
+    start = time.perf_counter()
+    # Workers create reports exclusively here; reports from earlier runs would look like clashes in out_dir
+    staging = tempfile.mkdtemp(prefix='.reports-', dir=out_dir)
+
+    try:
+        with open(os.path.join(out_dir, INDEX_FILE), 'w', encoding='utf-8') as index, \
+                ProcessPoolExecutor(jobs, initializer=_init_worker,
+                                    initargs=(model_path, scaler_path, staging)) as pool:
+            index.write('<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8"><title>Cohort Reports</title>'
+                        '</head><body><h1>Cohort Reports</h1>\n<table>\n'
+                        '<tr><th>Student</th><th>Predicted Score</th><th>Performance Level</th></tr>\n')
+
+            def collect(futures):
+                nonlocal count, files, renamed
+                for future in futures:
+                    for filename, student_id, score, level, was_renamed in future.result():
+                        index.write(f'<tr><td><a href="{filename}">{html.escape(student_id)}</a></td>'
+                                    f'<td>{score:.1f}</td><td>{level}</td></tr>\n')
+                        count += 1
+                        files += 1  # every row created its own file
+                        renamed += was_renamed
+
+            pending = set()
+            for X, ids, first_row in _iter_blocks(input_path, chunksize, block_size, id_column):
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(pool.submit(_render_block, X, ids, first_row))
+            collect(wait(pending).done)
+            index.write('</table>\n</body></html>\n')
+
+        with os.scandir(staging) as entries:
+            for entry in entries:
+                os.replace(entry.path, os.path.join(out_dir, entry.name))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'reports': count,
+        'files': files,
+        'renamed': renamed,
+        'seconds': elapsed,
+        'reports_per_sec': count / elapsed if elapsed > 0 else float('inf'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render printable HTML advice reports for a cohort.")
+    parser.add_argument('input', help="CSV or Parquet file in the Student_Performance.csv schema")
+    parser.add_argument('output_dir', help="Directory for the reports, index.html and shared assets")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE, help="Students per worker task")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows read from the input at a time")
+    parser.add_argument('--id-column', default=DEFAULT_ID_COLUMN,
+                        help="Column naming each student (rows are numbered if it is missing)")
+    parser.add_argument('--model', default='linear_regression_model.pkl', help="Model pickle or .json artifact")
+    parser.add_argument('--scaler', default='scaler.pkl')
+    args = parser.parse_args(argv)
+
+    stats = generate_reports(args.input, args.output_dir, args.jobs, args.block_size, args.chunksize,
+                             args.id_column, args.model, args.scaler)
+    print(f"Wrote {stats['files']:,} report files for {stats['reports']:,} students in {stats['seconds']:.1f}s "
+          f"({stats['reports_per_sec']:,.0f} reports/sec) -> {args.output_dir}/")
+    if stats['renamed']:
+        print(f"  {stats['renamed']:,} reports got a __row<n> suffix because their student ID repeated "
+              f"or clashed with another after sanitizing")
+
+
+if __name__ == '__main__':
+    main()
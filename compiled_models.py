@@ -0,0 +1,260 @@
+"""Array-based inference for the notebook's tree and nearest-neighbour candidates.
+
+DecisionTreeRegressor / RandomForestRegressor are flattened into packed
+node arrays (feature, threshold, children, value) shared by all trees.
+Inputs are scaled and cast to float32 before every threshold compare,
+exactly as scikit-learn does, so predictions are bit-identical.
+
+The training data is discrete, so each feature only ever sees a handful
+of distinct thresholds across the whole forest. Those thresholds cut the
+input space into cells in which every tree lands on the same leaves; the
+forest's prediction for each cell is precomputed once (about a million
+cells, a few MB), after which any input, on the sidebar grid or not, is
+a binary search per feature plus one table read. Forests trained on
+data with too many distinct values to tabulate are walked node by node
+in batch instead.
+
+KNeighborsRegressor has no comparable exact form: neighbour ties are
+common on this data and scikit-learn's choice among them depends on its
+search order. Its predictions for every sidebar input combination
+(lookup_table.GRID_BOUNDS) are precomputed by the fitted model itself,
+and inputs off that grid go to the model.
+"""
+import struct
+from bisect import bisect_left
+
+import numpy as np
+
+from predictor import FEATURE_COLS, NUMERICAL_COLS
+
+MAX_TABLE_CELLS = 1 << 22
+TRAVERSAL_BLOCK = 1 << 20  # (row, tree) pairs walked per numpy step
+
+_FLOAT32 = struct.Struct('f')
+
+
+def _check_features(model, scaler):
+    feature_cols = [str(c) for c in getattr(model, 'feature_names_in_', FEATURE_COLS)]
+    if feature_cols != FEATURE_COLS:
+        raise ValueError(f"Unexpected model features: {feature_cols}")
+    scaled_cols = [str(c) for c in getattr(scaler, 'feature_names_in_', NUMERICAL_COLS)]
+    return [FEATURE_COLS.index(col) for col in scaled_cols]
+
+
+class _Scaling:
+    """StandardScaler transform of the scaled columns, on a float64 copy."""
+
+    def __init__(self, mean, scale, scaled_index):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.index = list(scaled_index)
+
+    def __call__(self, X):
+        Z = np.array(X, dtype=np.float64)
+        # Same operations and order as StandardScaler.transform
+        scaled = Z[:, self.index]
+        scaled -= self.mean
+        scaled /= self.scale
+        Z[:, self.index] = scaled
+        return Z
+
+    def column(self, j):
+        """(mean, scale) applied to feature j, or None when it is passed through."""
+        if j not in self.index:
+            return None
+        k = self.index.index(j)
+        return float(self.mean[k]), float(self.scale[k])
+
+
+class CompiledTrees:
+    """A decision tree or a forest of them as packed node arrays plus a cell table.
+
+    Nodes of all trees are concatenated and roots holds each tree's first
+    node. Children are global node indices, -1 marking a leaf, as in
+    sklearn's tree_ arrays.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, depth, scaling):
+        leaf = np.asarray(left) < 0
+        nodes = np.arange(len(leaf), dtype=np.int32)
+        self.is_leaf = leaf
+        self.feature = np.where(leaf, 0, feature).astype(np.intp)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        # Leaves loop back to themselves; children[2 * node + went_left] is one gather per step
+        self.left = np.where(leaf, nodes, left).astype(np.int32)
+        self.right = np.where(leaf, nodes, right).astype(np.int32)
+        self.children = np.column_stack([self.right, self.left]).ravel()
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.depth = int(depth)
+        self.scaling = scaling
+
+        # Distinct split thresholds per feature; a value's cell along feature j is
+        # the number of them strictly below it, so x <= thresholds[k] iff cell <= k
+        self.cuts = [np.unique(self.threshold[~leaf & (self.feature == j)]) for j in range(len(FEATURE_COLS))]
+        self.shape = tuple(len(c) + 1 for c in self.cuts)
+        self.table = self._cell_table() if np.prod(self.shape, dtype=float) <= MAX_TABLE_CELLS else None
+        strides = [int(np.prod(self.shape[j + 1:])) for j in range(len(self.shape))]
+        self._strides = np.array(strides)
+        self._axes = [(scaling.column(j), c.tolist(), stride) for j, (c, stride) in enumerate(zip(self.cuts, strides))]
+
+    @classmethod
+    def from_sklearn(cls, model, scaler):
+        """Pack a fitted DecisionTreeRegressor or RandomForestRegressor."""
+        scaled_index = _check_features(model, scaler)
+        trees = [e.tree_ for e in getattr(model, 'estimators_', [model])]
+        if any(t.n_outputs != 1 for t in trees):
+            raise ValueError("Only single-output trees are supported")
+        offsets = np.cumsum([0] + [t.node_count for t in trees])
+
+        def relocate(children, offset):
+            return np.where(children < 0, -1, children + offset)
+
+        return cls(
+            np.concatenate([t.feature for t in trees]),
+            np.concatenate([t.threshold for t in trees]),
+            np.concatenate([relocate(t.children_left, o) for t, o in zip(trees, offsets)]),
+            np.concatenate([relocate(t.children_right, o) for t, o in zip(trees, offsets)]),
+            np.concatenate([t.value.reshape(-1) for t in trees]),
+            offsets[:-1],
+            max(t.max_depth for t in trees),
+            _Scaling(scaler.mean_, scaler.scale_, scaled_index),
+        )
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def _average(self, leaf_values, shape):
+        # Summed tree by tree, then divided, like RandomForestRegressor.predict
+        total = np.zeros(shape)
+        for values in leaf_values:
+            total += values
+        return total / self.n_trees if self.n_trees > 1 else total
+
+    def _tree_cells(self):
+        """Each tree's leaf value per cell, by pushing boxes of cells (not rows) down it."""
+        cut = np.zeros(len(self.value), dtype=np.int64)
+        for j, thresholds in enumerate(self.cuts):
+            nodes = ~self.is_leaf & (self.feature == j)
+            cut[nodes] = np.searchsorted(thresholds, self.threshold[nodes]) + 1
+        feature, cut, value = self.feature.tolist(), cut.tolist(), self.value.tolist()
+        left, right = self.left.tolist(), self.right.tolist()
+
+        out = np.empty(self.shape)
+        for root in self.roots.tolist():
+            stack = [(root, tuple(slice(0, n) for n in self.shape))]
+            while stack:
+                node, box = stack.pop()
+                if left[node] == node:
+                    out[box] = value[node]
+                    continue
+                j = feature[node]
+                lo, hi = box[j].start, box[j].stop
+                c = min(max(cut[node], lo), hi)
+                if c > lo:
+                    stack.append((left[node], box[:j] + (slice(lo, c),) + box[j + 1:]))
+                if c < hi:
+                    stack.append((right[node], box[:j] + (slice(c, hi),) + box[j + 1:]))
+            yield out
+
+    def _cell_table(self):
+        return self._average(self._tree_cells(), self.shape).reshape(-1)
+
+    def _traverse(self, Z):
+        scores = np.empty(len(Z))
+        block = max(1, TRAVERSAL_BLOCK // self.n_trees)
+        width = Z.shape[1]
+        for start in range(0, len(Z), block):
+            rows = Z[start:start + block]
+            flat = rows.ravel()
+            # One entry per (row, tree) pair; only pairs not yet at a leaf are walked
+            node = np.tile(self.roots, len(rows))
+            offset = np.repeat(np.arange(len(rows)) * width, self.n_trees)
+            active = np.flatnonzero(~self.is_leaf[node])
+            for _ in range(self.depth):
+                if not len(active):
+                    break
+                current = node[active]
+                went_left = flat[offset[active] + self.feature[current]] <= self.threshold[current]
+                current = self.children[2 * current + went_left]
+                node[active] = current
+                active = active[~self.is_leaf[current]]
+            scores[start:start + len(rows)] = self._average(self.value[node].reshape(len(rows), self.n_trees).T, len(rows))
+        return scores
+
+    def predict(self, X):
+        """Score an (N, 5) array or a single 5-element row."""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        # float32 inputs against float64 thresholds: the comparison sklearn makes
+        Z = self.scaling(X).astype(np.float32)
+        if self.table is None:
+            return self._traverse(Z)
+        index = np.zeros(len(Z), dtype=np.int64)
+        for j, (thresholds, stride) in enumerate(zip(self.cuts, self._strides)):
+            index += np.searchsorted(thresholds, Z[:, j]) * stride
+        return self.table[index]
+
+    def predict_one(self, hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers):
+        features = (hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers)
+        if self.table is None:
+            return float(self.predict(features)[0])
+        index = 0
+        try:
+            for value, (scaling, thresholds, stride) in zip(features, self._axes):
+                if scaling is not None:
+                    value = (value - scaling[0]) / scaling[1]
+                index += bisect_left(thresholds, _FLOAT32.unpack(_FLOAT32.pack(value))[0]) * stride
+        except OverflowError:
+            # Beyond float32 range, where numpy's cast saturates to +-inf instead
+            return float(self.predict(features)[0])
+        return self.table.item(index)
+
+
+class CompiledNeighbors:
+    """KNeighborsRegressor with its predictions precomputed over the sidebar input grid."""
+
+    def __init__(self, model, scaling):
+        from lookup_table import GRID_BOUNDS, GRID_SHAPE, grid_inputs
+
+        self.model = model
+        self.scaling = scaling
+        self._lower = np.array([lo for lo, _ in GRID_BOUNDS])
+        self._upper = np.array([hi for _, hi in GRID_BOUNDS])
+        self._strides = np.array([int(np.prod(GRID_SHAPE[i + 1:])) for i in range(len(GRID_SHAPE))])
+        self._bounds = [(lo, hi, int(stride)) for (lo, hi), stride in zip(GRID_BOUNDS, self._strides)]
+        self.scores = self._model_predict(grid_inputs())
+
+    @classmethod
+    def from_sklearn(cls, model, scaler):
+        scaled_index = _check_features(model, scaler)
+        return cls(model, _Scaling(scaler.mean_, scaler.scale_, scaled_index))
+
+    def _model_predict(self, X):
+        Z = self.scaling(X)
+        if hasattr(self.model, 'feature_names_in_'):
+            import pandas as pd
+
+            Z = pd.DataFrame(Z, columns=self.model.feature_names_in_)
+        return np.asarray(self.model.predict(Z), dtype=np.float64).reshape(-1)
+
+    def predict(self, X):
+        """Score an (N, 5) array or a single 5-element row."""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        covered = np.all((X >= self._lower) & (X <= self._upper) & (X == np.floor(X)), axis=1)
+        on_grid = self.scores[(X[covered].astype(np.int64) - self._lower) @ self._strides]
+        if covered.all():
+            return on_grid
+        scores = np.empty(len(X))
+        scores[covered] = on_grid
+        scores[~covered] = self._model_predict(X[~covered])
+        return scores
+
+    def predict_one(self, hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers):
+        features = (hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers)
+        index = 0
+        for value, (lower, upper, stride) in zip(features, self._bounds):
+            if not lower <= value <= upper or int(value) != value:
+                return float(self._model_predict(np.array([features], dtype=np.float64))[0])
+            index += (int(value) - lower) * stride
+        return self.scores.item(index)
@@ -0,0 +1,256 @@
+"""Plotly figures for the dashboard, built from prevalidated templates.
+
+Layout and styling are validated once per process. Each chart then only
+patches its data-bearing trace fields into the template, and finished
+figures are memoized on their (clamped) inputs in a bounded LRU.
+
+The memo holds Figure objects rather than their JSON or dicts because
+st.plotly_chart only skips revalidation for a Figure: rendering a cached
+Figure costs about 0.5 ms, a cached dict about 17 ms. Memoized figures
+are shared by every caller and must be treated as read-only. Run
+`python dashboard_charts.py` for a per-chart timing breakdown.
+"""
+import copy
+import functools
+import time
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import plotly.tools
+
+CHART_CACHE_SIZE = 512
+
+RADAR_CATEGORIES = ['Study Hours', 'Previous Performance', 'Practice Tests', 'Sleep Quality', 'Life Balance']
+ROADMAP_WEEKS = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
+
+RADAR_LAYOUT = dict(
+    polar=dict(
+        radialaxis=dict(visible=True, range=[0, 100], showticklabels=True, ticks='', tickfont=dict(color="black"), gridcolor='black'),
+        angularaxis=dict(tickfont=dict(color="black"), gridcolor='black'),
+        bgcolor='rgba(255, 255, 255, 0.6)'
+    ),
+    showlegend=False,
+    title="Your Performance Profile",
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='black', size=12),
+    height=400
+)
+
+GAUGE_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    font={'color': "black", 'family': "Arial"},
+    height=400
+)
+
+ROADMAP_LAYOUT = dict(
+    title="Your Growth Trajectory",
+    xaxis_title="Timeline",
+    yaxis_title="Performance Score",
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(255,255,255,0.1)',
+    font=dict(color='white'),
+    height=400,
+    hovermode='x unified'
+)
+
+
+def _radar_traces(values):
+    return [go.Scatterpolar(
+        r=values + [values[0]],
+        theta=RADAR_CATEGORIES + [RADAR_CATEGORIES[0]],
+        fill='toself',
+        fillcolor='rgba(0, 0, 0, 0.15)',
+        marker=dict(color='black', size=8),
+        line=dict(color='black', width=3)
+    )]
+
+
+def _gauge_traces(prediction, previous_scores):
+    return [go.Indicator(
+        mode="gauge+number+delta",
+        value=prediction,
+        number={'font': {'color': 'black', 'size': 44}},
+        delta={'reference': previous_scores, 'increasing': {'color': "green"}},
+        title={'text': "Performance Index", 'font': {'color': 'black', 'size': 20}},
+        gauge={
+            'axis': {'range': [None, 100], 'tickcolor': 'black'},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': 'rgba(255, 99, 71, 0.3)'},
+                {'range': [50, 70], 'color': 'rgba(255, 215, 0, 0.3)'},
+                {'range': [70, 85], 'color': 'rgba(50, 205, 50, 0.3)'},
+                {'range': [85, 100], 'color': 'rgba(0, 128, 0, 0.3)'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 85
+            }
+        }
+    )]
+
+
+def _roadmap_traces(projected_scores):
+    return [
+        go.Scatter(
+            x=ROADMAP_WEEKS, y=projected_scores,
+            mode='lines+markers',
+            name='Projected Progress',
+            line=dict(color='#00f2fe', width=4),
+            marker=dict(size=12, color='#4facfe')
+        ),
+        go.Scatter(
+            x=ROADMAP_WEEKS, y=[85] * 4,
+            mode='lines',
+            name='Excellence Target',
+            line=dict(color='green', width=2, dash='dash')
+        ),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _templates():
+    """Validated plain-dict figures, built once per process."""
+    def compile_figure(traces, layout):
+        return go.Figure(data=traces, layout=layout).to_dict()
+
+    return {
+        'radar': compile_figure(_radar_traces([0] * 5), RADAR_LAYOUT),
+        'gauge': compile_figure(_gauge_traces(0, 0), GAUGE_LAYOUT),
+        'roadmap': compile_figure(_roadmap_traces([0] * 4), ROADMAP_LAYOUT),
+    }
+
+
+def _from_template(name, *patches):
+    """Figure from a template with per-trace field patches applied.
+
+    Only plain numbers are patched into an already validated template, so
+    plotly's per-property validation (the bulk of construction cost) is
+    skipped.
+    """
+    template = _templates()[name]
+    data = [dict(trace, **patch) for trace, patch in zip(template['data'], patches)]
+    return go.Figure({'data': data, 'layout': template['layout']}, _validate=False)
+
+
+def _clamp(value, low, high):
+    return min(max(value, low), high)
+
+
+def chart_templates():
+    """Deep copies of the validated radar/gauge/roadmap figure dicts, e.g. for client-side rendering."""
+    return copy.deepcopy(_templates())
+
+
+def radar_values(hours_studied, previous_scores, sample_papers, sleep_hours, extracurricular):
+    """Closed polygon of the five 0-100 profile axes (inputs clamped to the slider ranges)."""
+    hours_studied, previous_scores = _clamp(hours_studied, 0, 10), _clamp(previous_scores, 0, 100)
+    sample_papers, sleep_hours = _clamp(sample_papers, 0, 10), _clamp(sleep_hours, 0, 12)
+    extracurricular = _clamp(extracurricular, 0, 1)
+    values = [
+        (hours_studied / 10) * 100,
+        previous_scores,
+        (sample_papers / 10) * 100,
+        (sleep_hours / 12) * 100,
+        extracurricular * 100
+    ]
+    return values + [values[0]]
+
+
+@functools.lru_cache(maxsize=CHART_CACHE_SIZE)
+def _radar_chart(hours_studied, previous_scores, sample_papers, sleep_hours, extracurricular):
+    return _from_template('radar', {'r': radar_values(hours_studied, previous_scores, sample_papers,
+                                                      sleep_hours, extracurricular)})
+
+
+def radar_chart(hours_studied, previous_scores, sample_papers, sleep_hours, extracurricular):
+    return _radar_chart(_clamp(hours_studied, 0, 10), _clamp(previous_scores, 0, 100),
+                        _clamp(sample_papers, 0, 10), _clamp(sleep_hours, 0, 12),
+                        _clamp(extracurricular, 0, 1))
+
+
+@functools.lru_cache(maxsize=CHART_CACHE_SIZE)
+def gauge_chart(prediction, previous_scores):
+    template_trace = _templates()['gauge']['data'][0]
+    return _from_template('gauge', {
+        'value': prediction,
+        'delta': dict(template_trace['delta'], reference=previous_scores),
+    })
+
+
+@functools.lru_cache(maxsize=CHART_CACHE_SIZE)
+def roadmap_chart(projected_scores):
+    """projected_scores: tuple of four weekly scores."""
+    return _from_template('roadmap', {'y': list(projected_scores)}, {})
+
+
+def cache_info():
+    return {
+        'radar': _radar_chart.cache_info(),
+        'gauge': gauge_chart.cache_info(),
+        'roadmap': roadmap_chart.cache_info(),
+    }
+
+
+def _render(figure_or_data):
+    # The conversion and serialization st.plotly_chart performs
+    figure = plotly.tools.return_figure_from_figure_or_data(figure_or_data, validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def timing_breakdown(repeat=200):
+    """Milliseconds per chart: full validated build vs template patch vs memo hit, plus rendering.
+
+    render_ms is what st.plotly_chart does with a memoized Figure and
+    dict_render_ms what it would do with the same figure cached as a dict.
+    """
+    def full_build(traces, layout):
+        # How the dashboard used to build every chart on every rerun
+        fig = go.Figure(data=traces)
+        fig.update_layout(**layout)
+        return fig
+
+    cases = {
+        'radar': (lambda: full_build(_radar_traces([50, 70, 30, 58, 100]), RADAR_LAYOUT),
+                  lambda: _radar_chart.__wrapped__(5, 70, 3, 7, 1),
+                  lambda: radar_chart(5, 70, 3, 7, 1)),
+        'gauge': (lambda: full_build(_gauge_traces(56.0, 70), GAUGE_LAYOUT),
+                  lambda: gauge_chart.__wrapped__(56.0, 70),
+                  lambda: gauge_chart(56.0, 70)),
+        'roadmap': (lambda: full_build(_roadmap_traces([56, 61, 68, 76]), ROADMAP_LAYOUT),
+                    lambda: roadmap_chart.__wrapped__((56, 61, 68, 76)),
+                    lambda: roadmap_chart((56, 61, 68, 76))),
+    }
+    _templates()
+
+    def per_call_ms(fn):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = fn()
+        return (time.perf_counter() - start) / repeat * 1000, result
+
+    breakdown = {}
+    for name, (full, patched, memoized) in cases.items():
+        full_ms, figure = per_call_ms(full)
+        patched_ms, _ = per_call_ms(patched)
+        memo_ms, _ = per_call_ms(memoized)
+        spec = figure.to_dict()
+        render_ms, _ = per_call_ms(lambda: _render(figure))
+        dict_render_ms, _ = per_call_ms(lambda: _render(spec))
+        breakdown[name] = {
+            'full_build_ms': full_ms,
+            'template_build_ms': patched_ms,
+            'memo_hit_ms': memo_ms,
+            'render_ms': render_ms,
+            'dict_render_ms': dict_render_ms,
+        }
+    return breakdown
+
+
+if __name__ == '__main__':
+    print(f"{'Chart':<10}{'Full build':>12}{'Template':>12}{'Memo hit':>12}{'Render':>12}{'Render dict':>13}"
+          "   (ms per call)")
+    for name, row in timing_breakdown().items():
+        print(f"{name:<10}{row['full_build_ms']:>12.3f}{row['template_build_ms']:>12.3f}"
+              f"{row['memo_hit_ms']:>12.4f}{row['render_ms']:>12.3f}{row['dict_render_ms']:>13.3f}")
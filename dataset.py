@@ -0,0 +1,202 @@
+"""Typed, memory-mapped columnar cache for Student_Performance-style CSVs.
+
+The CSV is parsed once into one .npy file per column under
+<csv dir>/.student_cache/<csv name>/: uint8 for small-range integer
+features (float32 if a column does not fit), bool for extracurricular and
+float32 for the target. Later loads memory-map those files instead of
+re-parsing text. The cache is rebuilt automatically when the source
+file's size/mtime change and its SHA-256 no longer matches.
+"""
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from batch_score import DEFAULT_CHUNKSIZE, encode_features, iter_chunks
+from model_registry import file_sha256
+from predictor import FEATURE_COLS
+
+TARGET_COL = 'Performance Index'
+CACHE_DIR_NAME = '.student_cache'
+CACHE_FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+EXTRACURRICULAR_COL = 'Extracurricular Activities'
+EXTRACURRICULAR_LABELS = np.array(['No', 'Yes'], dtype=object)
+
+# On-disk file name for every cached column
+COLUMN_FILES = {
+    'Hours Studied': 'hours_studied.npy',
+    'Previous Scores': 'previous_scores.npy',
+    'Extracurricular Activities': 'extracurricular.npy',
+    'Sleep Hours': 'sleep_hours.npy',
+    'Sample Question Papers Practiced': 'sample_papers.npy',
+    TARGET_COL: 'performance_index.npy',
+}
+
+
+def default_cache_dir(source_path):
+    directory, name = os.path.split(os.path.abspath(source_path))
+    return os.path.join(directory, CACHE_DIR_NAME, name)
+
+
+def _source_stamp(source_path):
+    stat = os.stat(source_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class StudentDataset:
+    """Memory-mapped columns of one cached source file."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.n_rows = len(next(iter(columns.values())))
+
+    def __len__(self):
+        return self.n_rows
+
+    @property
+    def has_target(self):
+        return TARGET_COL in self.columns
+
+    @property
+    def target(self):
+        return self.columns[TARGET_COL]
+
+    def features(self, start=0, stop=None):
+        """(N, 5) float64 rows in FEATURE_COLS order, ready for a predictor."""
+        stop = self.n_rows if stop is None else stop
+        X = np.empty((stop - start, len(FEATURE_COLS)), dtype=np.float64)
+        for j, col in enumerate(FEATURE_COLS):
+            X[:, j] = self.columns[col][start:stop]
+        return X
+
+    def iter_features(self, chunksize=DEFAULT_CHUNKSIZE):
+        for start in range(0, self.n_rows, chunksize):
+            yield self.features(start, min(start + chunksize, self.n_rows))
+
+    def frame(self, start=0, stop=None, encoded=False):
+        """DataFrame slice with the CSV's column names.
+
+        encoded=False restores the Yes/No labels; encoded=True returns every
+        column as float64 with extracurricular as 1/0, ready for training.
+        """
+        stop = self.n_rows if stop is None else stop
+        data = {}
+        for col, values in self.columns.items():
+            values = values[start:stop]
+            if encoded:
+                values = values.astype(np.float64)
+            elif col == EXTRACURRICULAR_COL:
+                values = EXTRACURRICULAR_LABELS[values.astype(np.intp)]
+            data[col] = values
+        return pd.DataFrame(data)
+
+    def iter_frames(self, chunksize=DEFAULT_CHUNKSIZE, encoded=False):
+        for start in range(0, self.n_rows, chunksize):
+            yield self.frame(start, min(start + chunksize, self.n_rows), encoded)
+
+
+def _build(source_path, cache_dir, chunksize):
+    """Stream the source into narrow-typed .npy columns inside cache_dir."""
+    parent = os.path.dirname(cache_dir)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.building-', dir=parent)
+    try:
+        # First pass: append every column to a raw float32 spill file and
+        # track whether it fits uint8.
+        spill = {}
+        fits_uint8 = {}
+        n_rows = 0
+        for chunk in iter_chunks(source_path, chunksize):
+            X = encode_features(chunk)
+            values = {col: X[:, j] for j, col in enumerate(FEATURE_COLS)}
+            if TARGET_COL in chunk.columns:
+                values[TARGET_COL] = chunk[TARGET_COL].to_numpy(dtype=np.float64)
+            for col, v in values.items():
+                if col not in spill:
+                    if n_rows:
+                        raise ValueError(f"Column {col!r} is missing from the first chunk")
+                    spill[col] = open(os.path.join(staging, COLUMN_FILES[col] + '.raw'), 'wb')
+                    fits_uint8[col] = True
+                fits_uint8[col] = fits_uint8[col] and bool(np.all((v >= 0) & (v <= 255) & (v == np.floor(v))))
+                spill[col].write(v.astype(np.float32).tobytes())
+            n_rows += len(chunk)
+        for file in spill.values():
+            file.close()
+
+        # Second pass: narrow each spill file into its final .npy
+        dtypes = {}
+        for col in spill:
+            if col == EXTRACURRICULAR_COL:
+                dtype = np.bool_
+            elif col == TARGET_COL or not fits_uint8[col]:
+                dtype = np.float32
+            else:
+                dtype = np.uint8
+            raw_path = os.path.join(staging, COLUMN_FILES[col] + '.raw')
+            raw = np.memmap(raw_path, dtype=np.float32, mode='r', shape=(n_rows,)) if n_rows else np.empty(0, np.float32)
+            out = np.lib.format.open_memmap(os.path.join(staging, COLUMN_FILES[col]), mode='w+',
+                                            dtype=dtype, shape=(n_rows,))
+            for start in range(0, n_rows, chunksize):
+                out[start:start + chunksize] = raw[start:start + chunksize]
+            out.flush()
+            del out, raw
+            os.remove(raw_path)
+            dtypes[col] = np.dtype(dtype).str
+
+        manifest = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'source': os.path.abspath(source_path),
+            'source_sha256': file_sha256(source_path),
+            'rows': n_rows,
+            'columns': {col: {'file': COLUMN_FILES[col], 'dtype': dtypes[col]} for col in spill},
+            **_source_stamp(source_path),
+        }
+        with open(os.path.join(staging, MANIFEST_FILE), 'w') as file:
+            json.dump(manifest, file, indent=2)
+
+        # Swap the finished cache into place
+        if os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir)
+        os.rename(staging, cache_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return manifest
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_FILE)) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('format_version') == CACHE_FORMAT_VERSION else None
+
+
+def load_dataset(source_path='Student_Performance.csv', cache_dir=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Memory-mapped StudentDataset for source_path, (re)building the cache if needed."""
+    cache_dir = cache_dir or default_cache_dir(source_path)
+    manifest = _read_manifest(cache_dir)
+    stamp = _source_stamp(source_path)
+
+    if manifest is not None and any(manifest[k] != v for k, v in stamp.items()):
+        # Touched but possibly unchanged (e.g. a fresh checkout): compare content
+        if manifest['source_sha256'] == file_sha256(source_path):
+            manifest.update(stamp)
+            tmp = os.path.join(cache_dir, MANIFEST_FILE + '.tmp')
+            with open(tmp, 'w') as file:
+                json.dump(manifest, file, indent=2)
+            os.replace(tmp, os.path.join(cache_dir, MANIFEST_FILE))
+        else:
+            manifest = None
+
+    if manifest is None:
+        manifest = _build(source_path, cache_dir, chunksize)
+
+    columns = {col: np.load(os.path.join(cache_dir, spec['file']), mmap_mode='r')
+               for col, spec in manifest['columns'].items()}
+    return StudentDataset(columns)
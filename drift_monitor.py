@@ -0,0 +1,467 @@
+"""Input and prediction drift monitoring with constant-memory summaries.
+
+Usage:
+    python drift_monitor.py reference --data Student_Performance.csv --output drift_reference.json
+    python drift_monitor.py compare scored.csv --reference drift_reference.json
+
+Every recorded prediction updates fixed-bin histograms and running
+mean/variance of each feature and of the predicted score. Single rows are
+buffered and folded in vectorized, so recording costs a list append.
+Every window_size rows (or window_seconds) the live window is scored
+against a reference:
+    psi         population stability index of the binned distributions
+                (< 0.1 stable, 0.1-0.25 moderate, > 0.25 significant drift)
+    mean_shift  |live mean - reference mean| in reference standard deviations
+The feature reference is either built from Student_Performance.csv
+(histograms and moments) or taken from a fitted scaler's mean/scale
+(moments of the scaled features only). Served models are monitored
+separately per (tenant, model version) by DriftMonitors, each against
+its own model's scores on the training rows.
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from predictor import FEATURE_COLS
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_COL = 'Predicted Score'
+MONITORED_COLS = FEATURE_COLS + [PREDICTION_COL]
+DEFAULT_REFERENCE_FILE = 'drift_reference.json'
+DEFAULT_MAX_MONITORS = 64
+
+# (low, high, step) of the histogram bins per column; values outside fall in overflow bins
+BIN_SPECS = {
+    'Hours Studied': (0, 10, 1),
+    'Previous Scores': (0, 100, 5),
+    'Extracurricular Activities': (0, 1, 1),
+    'Sleep Hours': (0, 12, 1),
+    'Sample Question Papers Practiced': (0, 10, 1),
+    PREDICTION_COL: (0, 100, 5),
+}
+BIN_EDGES = [np.arange(lo, hi + 2 * step, step, dtype=np.float64) for lo, hi, step in
+             (BIN_SPECS[col] for col in MONITORED_COLS)]
+
+PSI_WARN = 0.1
+PSI_ALERT = 0.25
+MEAN_SHIFT_WARN = 0.25
+MEAN_SHIFT_ALERT = 0.5
+PSI_EPSILON = 1e-4
+
+
+class StreamingSummary:
+    """Per-column bin counts plus running count, mean and M2 (sum of squared deviations).
+
+    Rows with a NaN or infinite value are counted in skipped and left out,
+    since one of them would turn the running moments into NaN for good.
+    """
+
+    def __init__(self):
+        width = len(MONITORED_COLS)
+        self.counts = [np.zeros(len(edges) + 1, dtype=np.int64) for edges in BIN_EDGES]
+        self.n = 0
+        self.skipped = 0
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)
+
+    def update(self, Z):
+        """Fold in rows Z (N, 6): FEATURE_COLS followed by the predicted score."""
+        Z = np.asarray(Z, dtype=np.float64)
+        finite = np.isfinite(Z).all(axis=1)
+        if not finite.all():
+            self.skipped += int(len(Z) - finite.sum())
+            Z = Z[finite]
+        if not len(Z):
+            return self
+        for j, edges in enumerate(BIN_EDGES):
+            bins = np.searchsorted(edges, Z[:, j], side='right')
+            self.counts[j] += np.bincount(bins, minlength=len(edges) + 1)
+        # Chan's parallel update of the moments
+        n_b = len(Z)
+        mean_b = Z.mean(axis=0)
+        m2_b = ((Z - mean_b) ** 2).sum(axis=0)
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.m2 = self.m2 + m2_b + delta ** 2 * (self.n * n_b / n)
+        self.mean = self.mean + delta * (n_b / n)
+        self.n = n
+        return self
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / self.n) if self.n else np.zeros(len(MONITORED_COLS))
+
+    def quantile(self, j, q):
+        """Approximate quantile of column j, interpolated within its histogram bins."""
+        counts = self.counts[j]
+        total = counts.sum()
+        if not total:
+            return None
+        edges = BIN_EDGES[j]
+        target = q * total
+        cumulative = np.cumsum(counts)
+        b = int(np.searchsorted(cumulative, target, side='left'))
+        if b == 0:
+            return float(edges[0])
+        if b == len(counts) - 1:
+            return float(edges[-1])
+        before = cumulative[b - 1]
+        fraction = (target - before) / counts[b] if counts[b] else 0.0
+        return float(edges[b - 1] + fraction * (edges[b] - edges[b - 1]))
+
+    def to_dict(self):
+        return {'n': self.n, 'skipped': self.skipped, 'mean': self.mean.tolist(), 'm2': self.m2.tolist(),
+                'counts': [c.tolist() for c in self.counts]}
+
+    @classmethod
+    def from_dict(cls, data):
+        summary = cls()
+        summary.n = int(data['n'])
+        summary.skipped = int(data.get('skipped', 0))
+        summary.mean = np.asarray(data['mean'], dtype=np.float64)
+        summary.m2 = np.asarray(data['m2'], dtype=np.float64)
+        summary.counts = [np.asarray(c, dtype=np.int64) for c in data['counts']]
+        return summary
+
+
+class Reference:
+    """Expected per-column mean/std and, when available, bin proportions."""
+
+    def __init__(self, source, mean, std, proportions=None):
+        self.source = source
+        self.mean = {col: float(v) for col, v in mean.items()}
+        self.std = {col: float(v) for col, v in std.items()}
+        self.proportions = proportions or {}
+
+    @classmethod
+    def from_summary(cls, source, summary):
+        mean = dict(zip(MONITORED_COLS, summary.mean))
+        std = dict(zip(MONITORED_COLS, summary.std))
+        proportions = {col: (summary.counts[j] / summary.n).tolist() for j, col in enumerate(MONITORED_COLS)}
+        return cls(source, mean, std, proportions)
+
+    @classmethod
+    def from_csv(cls, path='Student_Performance.csv', predictor=None):
+        """Reference from the training data; scores come from predictor, when given."""
+        from dataset import load_dataset
+
+        summary = StreamingSummary()
+        columns = len(MONITORED_COLS) if predictor is not None else len(FEATURE_COLS)
+        for X in load_dataset(path).iter_features():
+            scores = predictor.predict(X) if predictor is not None else np.full(len(X), np.nan)
+            summary.update(np.column_stack([X, scores]))
+        reference = cls.from_summary(os.path.basename(path), summary)
+        if columns < len(MONITORED_COLS):
+            reference.mean.pop(PREDICTION_COL)
+            reference.std.pop(PREDICTION_COL)
+            reference.proportions.pop(PREDICTION_COL)
+        return reference
+
+    def without_predictions(self):
+        """Copy of the feature columns only."""
+        def features(values):
+            return {col: v for col, v in values.items() if col != PREDICTION_COL}
+
+        return Reference(self.source, features(self.mean), features(self.std), features(self.proportions))
+
+    def with_predictions(self, X, scores):
+        """Copy whose prediction column summarizes scores of the training rows X."""
+        summary = StreamingSummary().update(np.column_stack([X, scores]))
+        reference = self.without_predictions()
+        reference.mean[PREDICTION_COL] = float(summary.mean[-1])
+        reference.std[PREDICTION_COL] = float(summary.std[-1])
+        reference.proportions[PREDICTION_COL] = (summary.counts[-1] / summary.n).tolist()
+        return reference
+
+    @classmethod
+    def from_scaler(cls, mean, scale, scaled_cols):
+        """Moments-only reference from a fitted StandardScaler's mean_/scale_."""
+        return cls('scaler', dict(zip(scaled_cols, mean)), dict(zip(scaled_cols, scale)))
+
+    def to_dict(self):
+        return {'source': self.source, 'mean': self.mean, 'std': self.std, 'proportions': self.proportions}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['source'], data['mean'], data['std'], data.get('proportions'))
+
+    def save(self, path):
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+
+def psi(expected, actual):
+    """Population stability index between two bin-proportion vectors."""
+    expected = np.asarray(expected, dtype=np.float64) + PSI_EPSILON
+    actual = np.asarray(actual, dtype=np.float64) + PSI_EPSILON
+    expected /= expected.sum()
+    actual /= actual.sum()
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def _status(value, warn, alert):
+    if value is None:
+        return None
+    return 'drift' if value > alert else 'warn' if value > warn else 'ok'
+
+
+def drift_scores(summary, reference):
+    """Per-column drift of a live summary against a reference."""
+    scores = {}
+    if not summary.n:
+        return scores
+    for j, col in enumerate(MONITORED_COLS):
+        if col not in reference.mean:
+            continue
+        shift = abs(float(summary.mean[j]) - reference.mean[col]) / (reference.std[col] or 1.0)
+        stability = None
+        if col in reference.proportions and summary.counts[j].sum():
+            stability = psi(reference.proportions[col], summary.counts[j] / summary.counts[j].sum())
+        statuses = [s for s in (_status(stability, PSI_WARN, PSI_ALERT),
+                                _status(shift, MEAN_SHIFT_WARN, MEAN_SHIFT_ALERT)) if s]
+        scores[col] = {
+            'psi': stability,
+            'mean_shift': shift,
+            'live_mean': float(summary.mean[j]),
+            'reference_mean': reference.mean[col],
+            'live_p50': summary.quantile(j, 0.5),
+            'status': max(statuses, key=('ok', 'warn', 'drift').index) if statuses else None,
+        }
+    return scores
+
+
+class DriftMonitor:
+    """Thread-safe recorder that scores each completed window against a reference.
+
+    Without a reference (it failed to load) predictions are still counted
+    but windows are never scored.
+    """
+
+    def __init__(self, reference=None, window_size=1000, window_seconds=300.0, history=48, flush_every=256):
+        self.reference = reference
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self.flush_every = flush_every
+        self.history = deque(maxlen=history)
+        self.total = StreamingSummary()
+        self._window = StreamingSummary()
+        self._window_started = time.time()
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def record(self, features, score):
+        """Record one prediction: features in FEATURE_COLS order and its score."""
+        row = list(features)
+        row.append(score)
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def record_batch(self, X, scores):
+        Z = np.column_stack([np.asarray(X, dtype=np.float64), np.asarray(scores, dtype=np.float64)])
+        with self._lock:
+            self._flush()
+            self._fold(Z)
+
+    def _fold(self, Z):
+        # Called with the lock held
+        self.total.update(Z)
+        self._window.update(Z)
+        if self.reference is not None and (self._window.n >= self.window_size
+                                           or time.time() - self._window_started >= self.window_seconds):
+            self._close_window()
+
+    def _flush(self):
+        if self._pending:
+            Z = np.array(self._pending, dtype=np.float64)
+            self._pending = []
+            self._fold(Z)
+
+    def _close_window(self):
+        if self._window.n:
+            self.history.append({
+                'started': self._window_started,
+                'ended': time.time(),
+                'rows': self._window.n,
+                'columns': drift_scores(self._window, self.reference),
+            })
+        self._window = StreamingSummary()
+        self._window_started = time.time()
+
+    def report(self):
+        """Drift of everything recorded so far, plus the recent window history."""
+        with self._lock:
+            self._flush()
+            return {
+                'reference': self.reference.source if self.reference is not None else None,
+                'rows': self.total.n,
+                'skipped_rows': self.total.skipped,
+                'overall': drift_scores(self.total, self.reference) if self.reference is not None else {},
+                'windows': list(self.history),
+            }
+
+
+def reference_data(data_path='Student_Performance.csv', artifact_path='linear_regression_model.json'):
+    """(feature reference, training feature rows or None) for DriftMonitors.
+
+    The features come from the saved reference file, else the training
+    CSV, else the artifact's scaler moments. The training rows, when the
+    CSV is present, let each model's prediction reference be computed.
+    """
+    X = None
+    if os.path.exists(data_path):
+        from dataset import load_dataset
+
+        X = load_dataset(data_path).features()
+    if os.path.exists(DEFAULT_REFERENCE_FILE):
+        return Reference.load(DEFAULT_REFERENCE_FILE).without_predictions(), X
+    if X is not None:
+        summary = StreamingSummary().update(np.column_stack([X, np.full(len(X), np.nan)]))
+        return Reference.from_summary(os.path.basename(data_path), summary).without_predictions(), X
+    with open(artifact_path) as file:
+        artifact = json.load(file)
+    return Reference.from_scaler(artifact['scaler_mean'], artifact['scaler_scale'], artifact['scaled_features']), None
+
+
+class DriftMonitors:
+    """One DriftMonitor per (tenant, model version), kept in a bounded LRU.
+
+    Every monitor shares the feature reference. Its prediction reference
+    is its own model's scores on the training rows, so district models and
+    new versions are never compared with another model's predictions.
+    load_reference runs once, when the pool is created, so no request
+    ever pays for reading the training data.
+    """
+
+    def __init__(self, load_reference=reference_data, max_monitors=DEFAULT_MAX_MONITORS, **monitor_options):
+        self.max_monitors = max_monitors
+        self.monitor_options = monitor_options
+        self.base = None
+        self.features = None
+        self._lock = threading.Lock()
+        self._monitors = OrderedDict()
+        try:
+            self.base, self.features = load_reference()
+        except Exception:
+            logger.exception("Failed to load the drift reference; drift will not be scored")
+
+    def _reference_for(self, predictor):
+        if self.base is None:
+            return None
+        if self.features is None:
+            return self.base
+        return self.base.with_predictions(self.features, predictor.predict(self.features))
+
+    def get(self, tenant, loaded):
+        """Monitor of tenant's LoadedModel (its version and predictor)."""
+        key = (tenant, loaded.version)
+        with self._lock:
+            monitor = self._monitors.get(key)
+            if monitor is not None:
+                self._monitors.move_to_end(key)
+                return monitor
+        # Scores the training rows once per model version, outside the lock
+        monitor = DriftMonitor(self._reference_for(loaded.predictor), **self.monitor_options)
+        with self._lock:
+            monitor = self._monitors.setdefault(key, monitor)
+            while len(self._monitors) > self.max_monitors:
+                self._monitors.popitem(last=False)
+        return monitor
+
+    def discard(self, tenant):
+        """Drop every monitor of tenant, e.g. when its model is evicted."""
+        with self._lock:
+            for key in [key for key in self._monitors if key[0] == tenant]:
+                del self._monitors[key]
+
+    def report(self, tenant=None):
+        """Reports keyed by 'tenant@version', optionally for one tenant only."""
+        with self._lock:
+            monitors = [(key, m) for key, m in self._monitors.items() if tenant is None or key[0] == tenant]
+        return {f'{t}@{v}': monitor.report() for (t, v), monitor in monitors}
+
+
+def render_drift_panel(st, monitor, label=''):
+    """Sidebar admin view of the live drift scores."""
+    report = monitor.report()
+    prefix = f"{label}: " if label else ''
+    with st.sidebar.expander("📉 Input Drift", expanded=False):
+        if report['reference'] is None:
+            st.caption(f"{prefix}{report['rows']:,} predictions; no drift reference available")
+            return
+        skipped = f" ({report['skipped_rows']:,} non-finite skipped)" if report['skipped_rows'] else ''
+        st.caption(f"{prefix}{report['rows']:,} predictions vs {report['reference']}{skipped}")
+        st.dataframe(
+            [{'column': col, 'status': s['status'], 'psi': s['psi'], 'mean_shift': s['mean_shift'],
+              'live_mean': s['live_mean'], 'ref_mean': s['reference_mean']} for col, s in report['overall'].items()],
+            hide_index=True,
+        )
+        if report['windows']:
+            latest = report['windows'][-1]
+            st.caption(f"Latest window: {latest['rows']:,} rows")
+            st.dataframe(
+                [{'column': col, 'status': s['status'], 'psi': s['psi'], 'mean_shift': s['mean_shift']}
+                 for col, s in latest['columns'].items()],
+                hide_index=True,
+            )
+        st.download_button("Download drift JSON", json.dumps(report, indent=2),
+                           file_name='drift_report.json', mime='application/json')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build drift references and check files against them.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('reference', help="Precompute reference statistics from training data")
+    build.add_argument('--data', default='Student_Performance.csv')
+    build.add_argument('--model', default='linear_regression_model.json', help="Model used for the score reference")
+    build.add_argument('--scaler', default='scaler.pkl')
+    build.add_argument('--output', default=DEFAULT_REFERENCE_FILE)
+    compare = commands.add_parser('compare', help="Drift of a cohort file against the reference")
+    compare.add_argument('input', help="CSV or Parquet file in the Student_Performance.csv schema")
+    compare.add_argument('--reference', default=DEFAULT_REFERENCE_FILE)
+    compare.add_argument('--model', default='linear_regression_model.json')
+    compare.add_argument('--scaler', default='scaler.pkl')
+    args = parser.parse_args(argv)
+
+    from model_artifact import load_predictor
+
+    predictor = load_predictor(args.model, args.scaler)
+    if args.command == 'reference':
+        reference = Reference.from_csv(args.data, predictor)
+        reference.save(args.output)
+        print(f"Saved reference from {args.data} -> {args.output}")
+        return
+
+    from batch_score import encode_features, iter_chunks
+
+    reference = Reference.load(args.reference)
+    summary = StreamingSummary()
+    for chunk in iter_chunks(args.input):
+        X = encode_features(chunk)
+        summary.update(np.column_stack([X, predictor.predict(X)]))
+    print(f"{'Column':<36}{'PSI':>10}{'Mean shift':>12}  Status")
+    for col, s in drift_scores(summary, reference).items():
+        psi_text = f"{s['psi']:>10.4f}" if s['psi'] is not None else f"{'-':>10}"
+        shift_text = f"{s['mean_shift']:>12.3f}" if s['mean_shift'] is not None else f"{'-':>12}"
+        print(f"{col:<36}{psi_text}{shift_text}  {s['status']}")
+    if summary.skipped:
+        print(f"Skipped {summary.skipped:,} row(s) with missing or non-finite values")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""Incremental model updates from running sufficient statistics.
+
+Usage:
+    python incremental.py update Student_Performance.csv --state model_state.npz
+    python incremental.py update new_results.csv --state model_state.npz --output-dir artifacts --publish models
+
+The state file keeps the row count, the column means and the centered
+co-moment matrix of [features, target]. New rows are folded in with
+Chan's parallel update, and the StandardScaler + LinearRegression are
+re-solved from the 6x6 statistics. The result matches a full refit on
+every row seen so far, while an update costs O(new rows).
+"""
+import argparse
+import os
+import pickle
+
+import numpy as np
+
+from batch_score import DEFAULT_CHUNKSIZE, encode_features, iter_chunks
+from predictor import FEATURE_COLS, NUMERICAL_COLS, CompiledPredictor
+
+TARGET_COL = 'Performance Index'
+SCALED_INDEX = [FEATURE_COLS.index(col) for col in NUMERICAL_COLS]
+
+
+class IncrementalTrainer:
+    """Running mean and co-moments of [X, y] for an exact streaming OLS fit."""
+
+    def __init__(self):
+        width = len(FEATURE_COLS) + 1
+        self.n = 0
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros((width, width))
+
+    def partial_fit(self, X, y):
+        """Fold in a batch of encoded rows (FEATURE_COLS order) and targets."""
+        Z = np.column_stack([np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+        if not len(Z):
+            return self
+        batch_n = len(Z)
+        batch_mean = Z.mean(axis=0)
+        centered = Z - batch_mean
+        self._combine(batch_n, batch_mean, centered.T @ centered)
+        return self
+
+    def partial_fit_frame(self, df):
+        return self.partial_fit(encode_features(df), df[TARGET_COL].to_numpy(dtype=np.float64))
+
+    def partial_fit_file(self, path, chunksize=DEFAULT_CHUNKSIZE):
+        for chunk in iter_chunks(path, chunksize):
+            self.partial_fit_frame(chunk)
+        return self
+
+    def merge(self, other):
+        """Combine with statistics gathered elsewhere (e.g. another shard)."""
+        if other.n:
+            self._combine(other.n, other.mean, other.m2)
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b):
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.m2 = self.m2 + m2_b + np.outer(delta, delta) * (n_a * n_b / n)
+        self.mean = self.mean + delta * (n_b / n)
+        self.n = n
+
+    def scaler_params(self):
+        """(mean, var, scale) of the scaled columns, as StandardScaler computes them."""
+        mean = self.mean[SCALED_INDEX]
+        var = np.diag(self.m2)[SCALED_INDEX] / self.n
+        scale = np.sqrt(var)
+        scale[scale == 0] = 1.0
+        return mean, var, scale
+
+    def solve(self):
+        """(coef, intercept) of the regression on scaled features."""
+        if self.n < 2:
+            raise ValueError("Need at least two rows to fit")
+        k = len(FEATURE_COLS)
+        cxx = self.m2[:k, :k]
+        cxy = self.m2[:k, k]
+        # Raw-feature slopes of the centered least-squares problem
+        beta = np.linalg.lstsq(cxx, cxy, rcond=None)[0]
+
+        _, _, scale = self.scaler_params()
+        coef = beta.copy()
+        coef[SCALED_INDEX] = beta[SCALED_INDEX] * scale
+        # Scaled columns have zero mean, so only the unscaled ones shift the intercept
+        unscaled = [j for j in range(k) if j not in SCALED_INDEX]
+        intercept = self.mean[k] - coef[unscaled] @ self.mean[unscaled]
+        return coef, float(intercept)
+
+    def to_predictor(self):
+        coef, intercept = self.solve()
+        mean, _, scale = self.scaler_params()
+        return CompiledPredictor.from_params(coef, intercept, mean, scale)
+
+    def to_sklearn(self):
+        """Fitted (LinearRegression, StandardScaler) equivalent to a full refit."""
+        from sklearn.linear_model import LinearRegression
+        from sklearn.preprocessing import StandardScaler
+
+        coef, intercept = self.solve()
+        mean, var, scale = self.scaler_params()
+
+        scaler = StandardScaler()
+        scaler.mean_, scaler.var_, scaler.scale_ = mean, var, scale
+        scaler.n_samples_seen_ = self.n
+        scaler.n_features_in_ = len(NUMERICAL_COLS)
+        scaler.feature_names_in_ = np.array(NUMERICAL_COLS, dtype=object)
+
+        model = LinearRegression()
+        model.coef_, model.intercept_ = coef, intercept
+        model.n_features_in_ = len(FEATURE_COLS)
+        model.feature_names_in_ = np.array(FEATURE_COLS, dtype=object)
+        return model, scaler
+
+    def save(self, path):
+        tmp = path + '.tmp.npz'
+        np.savez(tmp, n=self.n, mean=self.mean, m2=self.m2)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        trainer = cls()
+        with np.load(path) as state:
+            trainer.n = int(state['n'])
+            trainer.mean = state['mean']
+            trainer.m2 = state['m2']
+        return trainer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fold new rows into the incremental model state.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    update = commands.add_parser('update', help="Add rows from CSV/Parquet files and re-solve")
+    update.add_argument('inputs', nargs='+', help="Files in the Student_Performance.csv schema")
+    update.add_argument('--state', default='model_state.npz', help="Sufficient-statistics file (created if missing)")
+    update.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    update.add_argument('--output-dir', default='artifacts', help="Where to write model.pkl, scaler.pkl and model.json")
+    update.add_argument('--publish', metavar='REGISTRY_DIR', default=None,
+                        help="Also publish the re-solved model to this registry and activate it")
+    args = parser.parse_args(argv)
+
+    trainer = IncrementalTrainer.load(args.state) if os.path.exists(args.state) else IncrementalTrainer()
+    before = trainer.n
+    for path in args.inputs:
+        trainer.partial_fit_file(path, args.chunksize)
+    trainer.save(args.state)
+    print(f"Folded in {trainer.n - before:,} rows ({trainer.n:,} total) -> {args.state}")
+
+    from model_artifact import export_artifact
+
+    model, scaler = trainer.to_sklearn()
+    os.makedirs(args.output_dir, exist_ok=True)
+    model_path = os.path.join(args.output_dir, 'model.pkl')
+    scaler_path = os.path.join(args.output_dir, 'scaler.pkl')
+    with open(model_path, 'wb') as file:
+        pickle.dump(model, file)
+    with open(scaler_path, 'wb') as file:
+        pickle.dump(scaler, file)
+    export_artifact(model, scaler, os.path.join(args.output_dir, 'model.json'))
+    print(f"Saved model, scaler and model.json to {args.output_dir}/")
+
+    if args.publish:
+        from model_registry import ModelRegistry
+        version = ModelRegistry(args.publish).publish(model_path, scaler_path)
+        print(f"Published {version} to {args.publish}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""Opt-in per-stage latency instrumentation for the dashboard.
+
+Enabled with STUDENT_DASHBOARD_PROFILE=1 or the ?profile=1 query param.
+Timings from every session are aggregated in-process into rolling
+windows and cumulative histograms, exposed via an admin sidebar panel and
+as a JSON metrics dump (METRICS.to_json(), or the panel's download).
+Resetting the process-wide metrics from the panel additionally requires
+STUDENT_DASHBOARD_ADMIN=1 on the server; the query param cannot enable it.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+PROFILE_ENV = 'STUDENT_DASHBOARD_PROFILE'
+METRICS_FILE_ENV = 'STUDENT_DASHBOARD_METRICS_FILE'
+ADMIN_ENV = 'STUDENT_DASHBOARD_ADMIN'
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+WINDOW_SIZE = 1000
+
+
+def profiling_enabled(query_params=None):
+    if os.environ.get(PROFILE_ENV, '').lower() in ('1', 'true', 'yes'):
+        return True
+    return bool(query_params) and query_params.get('profile') in ('1', 'true', 'yes')
+
+
+def admin_enabled():
+    """Whether the panel may modify shared state; set only by the server's environment."""
+    return os.environ.get(ADMIN_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+class StageHistogram:
+    """Rolling window of recent durations plus cumulative bucket counts."""
+
+    def __init__(self, window_size=WINDOW_SIZE):
+        self.window = deque(maxlen=window_size)
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.total = 0
+        self.total_ms = 0.0
+
+    def record(self, ms):
+        self.window.append(ms)
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.total += 1
+        self.total_ms += ms
+
+    def summary(self):
+        recent = sorted(self.window)
+
+        def quantile(q):
+            return recent[min(len(recent) - 1, int(q * len(recent)))] if recent else None
+
+        return {
+            'count': self.total,
+            'mean_ms': self.total_ms / self.total if self.total else None,
+            'window': len(recent),
+            'p50_ms': quantile(0.50),
+            'p90_ms': quantile(0.90),
+            'p99_ms': quantile(0.99),
+            'max_ms': recent[-1] if recent else None,
+            'buckets': {('le_' + str(b)) if i < len(BUCKET_BOUNDS_MS) else 'inf': self.counts[i]
+                        for i, b in enumerate(BUCKET_BOUNDS_MS + (None,))},
+        }
+
+
+class MetricsRegistry:
+    """Process-wide, thread-safe stage timings shared by all sessions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self.started = time.time()
+
+    def record(self, stage, ms):
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = StageHistogram()
+            histogram.record(ms)
+
+    def snapshot(self):
+        with self._lock:
+            stages = {name: h.summary() for name, h in self._stages.items()}
+        return {'since': self.started, 'generated': time.time(), 'stages': stages}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def write(self, path):
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as file:
+            file.write(self.to_json())
+        os.replace(tmp, path)
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self.started = time.time()
+
+    def discard(self, prefix):
+        """Drop every stage whose name starts with prefix."""
+        with self._lock:
+            for name in [name for name in self._stages if name.startswith(prefix)]:
+                del self._stages[name]
+
+
+METRICS = MetricsRegistry()
+
+
+class RunProfiler:
+    """Times the named stages of one dashboard rerun; a no-op when disabled."""
+
+    def __init__(self, enabled, registry=METRICS):
+        self.enabled = enabled
+        self.registry = registry
+        self.stages = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + ms
+            self.registry.record(name, ms)
+
+    def stage(self, name):
+        return self._timed(name) if self.enabled else nullcontext()
+
+    def mark(self, name):
+        """Record the time from the start of the rerun to now as stage `name`."""
+        if not self.enabled:
+            return
+        ms = (time.perf_counter() - self._start) * 1000
+        self.stages[name] = ms
+        self.registry.record(name, ms)
+
+    def finish(self):
+        """Record the whole rerun as the 'total' stage."""
+        if not self.enabled:
+            return
+        ms = (time.perf_counter() - self._start) * 1000
+        self.stages['total'] = ms
+        self.registry.record('total', ms)
+        path = os.environ.get(METRICS_FILE_ENV)
+        if path:
+            self.registry.write(path)
+
+
+def render_admin_panel(st, profiler, registry=METRICS, caches=None, tenants=None):
+    """Sidebar panel with this rerun's stage times, the aggregated histograms and cache counters.
+
+    caches: optional {name: stats dict} shown as one row per cache.
+    tenants: optional {tenant: {'load': summary, 'predict': summary}} latency summaries.
+    """
+    with st.sidebar.expander("🛠️ Rerun Profiling", expanded=False):
+        st.caption("This rerun (ms)")
+        st.dataframe(
+            [{'stage': name, 'ms': round(ms, 3)} for name, ms in profiler.stages.items()],
+            hide_index=True,
+        )
+        snapshot = registry.snapshot()
+        st.caption("All sessions, rolling window (ms)")
+        st.dataframe(
+            [{'stage': name, 'count': s['count'], 'p50': s['p50_ms'], 'p90': s['p90_ms'],
+              'p99': s['p99_ms'], 'max': s['max_ms']} for name, s in snapshot['stages'].items()],
+            hide_index=True,
+        )
+        if caches:
+            st.caption("Caches")
+            st.dataframe([dict(cache=name, **stats) for name, stats in caches.items()], hide_index=True)
+            snapshot['caches'] = caches
+        if tenants:
+            st.caption("Per-tenant model latency (ms)")
+            st.dataframe(
+                [{'tenant': tenant, 'kind': kind, 'count': s['count'], 'p50': s['p50_ms'], 'p99': s['p99_ms'],
+                  'max': s['max_ms']} for tenant, kinds in tenants.items() for kind, s in kinds.items()],
+                hide_index=True,
+            )
+            snapshot['tenants'] = tenants
+        st.download_button("Download metrics JSON", json.dumps(snapshot, indent=2),
+                           file_name='dashboard_metrics.json', mime='application/json')
+        # Wipes the metrics of every session, so ?profile=1 alone must not reach it
+        if admin_enabled() and st.button("Reset metrics"):
+            registry.reset()
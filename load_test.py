@@ -0,0 +1,114 @@
+"""Load test for scoring_service.py.
+
+Usage:
+    python scoring_service.py --port 8000 &
+    python load_test.py --port 8000 --concurrency 64 --requests 20000
+
+Each client keeps one HTTP/1.1 connection open and sends random students to
+the chosen endpoint back-to-back; latency percentiles and throughput are
+reported at the end.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+
+
+def random_student(rng):
+    return {
+        'hours_studied': rng.randint(0, 10),
+        'previous_scores': rng.randint(0, 100),
+        'extracurricular': rng.choice(('Yes', 'No')),
+        'sleep_hours': rng.randint(0, 12),
+        'sample_papers': rng.randint(0, 10),
+    }
+
+
+def build_request(host, path, payload):
+    body = json.dumps(payload).encode()
+    head = (f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, path, count, batch_size, seed, latencies, errors):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            if batch_size > 1:
+                payload = {'students': [random_student(rng) for _ in range(batch_size)]}
+            else:
+                payload = random_student(rng)
+            request = build_request(host, path, payload)
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, path, total_requests, concurrency, batch_size):
+    latencies, errors = [], []
+    per_client = [total_requests // concurrency + (i < total_requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, path, n, batch_size, i, latencies, errors)
+                           for i, n in enumerate(per_client) if n))
+    elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'seconds': elapsed,
+        'requests_per_sec': len(latencies) / elapsed,
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the scoring service on localhost.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--endpoint', default='/predict',
+                        choices=('/predict', '/predict/batch', '/recommendations'))
+    parser.add_argument('--requests', type=int, default=10_000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help="Students per request (sent as {\"students\": [...]} when > 1)")
+    args = parser.parse_args(argv)
+
+    if args.endpoint == '/predict/batch' and args.batch_size == 1:
+        args.batch_size = 100
+    result = asyncio.run(run(args.host, args.port, args.endpoint, args.requests, args.concurrency, args.batch_size))
+    print(f"{result['requests']:,} requests to {args.endpoint} in {result['seconds']:.2f}s "
+          f"({result['requests_per_sec']:,.0f} req/s), errors: {result['errors']}")
+    print(f"latency p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, max {result['max_ms']:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
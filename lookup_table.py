@@ -0,0 +1,108 @@
+import itertools
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from model_registry import file_sha256
+from predictor import performance_level_code
+
+# Inclusive bounds of every sidebar input, in FEATURE_COLS order
+GRID_BOUNDS = ((0, 10), (0, 100), (0, 1), (0, 12), (0, 10))
+GRID_SHAPE = tuple(hi - lo + 1 for lo, hi in GRID_BOUNDS)
+
+TABLE_DTYPE = np.dtype([('score', '<f4'), ('level', 'u1')])
+TABLE_FILE = 'prediction_table.npy'
+TABLE_META_FILE = 'prediction_table.json'
+
+
+def grid_inputs():
+    """Every sidebar input combination as an (N, 5) array in table order."""
+    axes = [range(lo, hi + 1) for lo, hi in GRID_BOUNDS]
+    return np.array(list(itertools.product(*axes)), dtype=np.float64)
+
+
+class PredictionTable:
+    """Precomputed score/performance level for every sidebar input combination.
+
+    Entries are stored row-major over GRID_SHAPE, so a lookup is a single
+    index computation into a memory-mapped array.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.scores = table['score']
+        self.levels = table['level']
+        self._strides = np.array([int(np.prod(GRID_SHAPE[i + 1:])) for i in range(len(GRID_SHAPE))])
+        self._lower = np.array([lo for lo, _ in GRID_BOUNDS])
+        self._upper = np.array([hi for _, hi in GRID_BOUNDS])
+
+    @classmethod
+    def build(cls, predict):
+        X = grid_inputs()
+        scores = predict(X)
+        table = np.empty(len(X), dtype=TABLE_DTYPE)
+        table['score'] = scores
+        table['level'] = performance_level_code(scores)
+        return cls(table)
+
+    def covers(self, X):
+        """Row mask of inputs that fall on the precomputed grid."""
+        X = np.atleast_2d(X)
+        return np.all((X >= self._lower) & (X <= self._upper) & (X == np.floor(X)), axis=1)
+
+    def index(self, X):
+        X = np.atleast_2d(np.asarray(X))
+        if not self.covers(X).all():
+            raise ValueError("Inputs fall outside the precomputed grid")
+        return (X.astype(np.int64) - self._lower) @ self._strides
+
+    def lookup(self, hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers):
+        idx = self.index([hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers])[0]
+        return float(self.scores[idx]), int(self.levels[idx])
+
+    def lookup_batch(self, X):
+        idx = self.index(X)
+        return np.asarray(self.scores[idx]), np.asarray(self.levels[idx])
+
+
+def _replace_atomically(path, write):
+    """Write path through a uniquely named temp file, so concurrent builders never share one."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            write(file)
+        os.chmod(tmp, 0o644)  # mkstemp creates files readable by the owner only
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_or_build(predict, source_paths=('linear_regression_model.pkl', 'scaler.pkl')):
+    """Memory-map the table next to the model, rebuilding it if the model files changed."""
+    directory = os.path.dirname(os.path.abspath(source_paths[0]))
+    table_path = os.path.join(directory, TABLE_FILE)
+    meta_path = os.path.join(directory, TABLE_META_FILE)
+    meta = {
+        'sources': {os.path.basename(path): file_sha256(path) for path in source_paths},
+        'grid_bounds': [list(b) for b in GRID_BOUNDS],
+    }
+
+    try:
+        with open(meta_path) as file:
+            stale = json.load(file) != meta
+        table = np.load(table_path, mmap_mode='r')
+        stale = stale or table.dtype != TABLE_DTYPE or table.shape != (int(np.prod(GRID_SHAPE)),)
+    except (OSError, ValueError):
+        stale = True
+
+    if stale:
+        built = PredictionTable.build(predict)
+        # Write to temp files first so concurrent readers never see a partial table
+        _replace_atomically(table_path, lambda file: np.save(file, built.table))
+        _replace_atomically(meta_path, lambda file: file.write(json.dumps(meta, indent=2).encode()))
+        table = np.load(table_path, mmap_mode='r')
+
+    return PredictionTable(table)
@@ -0,0 +1,113 @@
+"""Pickle-free JSON artifact for the fitted scaler + linear model.
+
+Usage:
+    python model_artifact.py export linear_regression_model.pkl scaler.pkl linear_regression_model.json
+
+The artifact only holds numbers and column names, so loading it needs
+neither pickle nor scikit-learn. Pickled tree and nearest-neighbour
+models are compiled at load time instead (see compiled_models.py).
+"""
+import argparse
+import json
+import os
+import pickle
+
+from predictor import FEATURE_COLS, NUMERICAL_COLS, CompiledPredictor
+
+ARTIFACT_SCHEMA_VERSION = 1
+ARTIFACT_KIND = 'standard_scaler+linear_regression'
+
+
+def artifact_dict(model, scaler):
+    """JSON-ready parameters of a fitted LinearRegression and StandardScaler."""
+    import sklearn
+
+    def as_list(values):
+        return None if values is None else [float(v) for v in values]
+
+    return {
+        'schema_version': ARTIFACT_SCHEMA_VERSION,
+        'kind': ARTIFACT_KIND,
+        'sklearn_version': sklearn.__version__,
+        'feature_order': [str(c) for c in getattr(model, 'feature_names_in_', FEATURE_COLS)],
+        'scaled_features': [str(c) for c in getattr(scaler, 'feature_names_in_', NUMERICAL_COLS)],
+        'coef': as_list(model.coef_.ravel()),
+        'intercept': float(model.intercept_),
+        'scaler_mean': as_list(scaler.mean_),
+        'scaler_scale': as_list(scaler.scale_),
+    }
+
+
+def export_artifact(model, scaler, path):
+    artifact = artifact_dict(model, scaler)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as file:
+        json.dump(artifact, file, indent=2)
+    os.replace(tmp, path)
+    return artifact
+
+
+def predictor_from_dict(artifact):
+    if artifact.get('schema_version') != ARTIFACT_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported artifact schema version: {artifact.get('schema_version')}")
+    if artifact.get('kind') != ARTIFACT_KIND:
+        raise ValueError(f"Unsupported artifact kind: {artifact.get('kind')}")
+    return CompiledPredictor.from_params(
+        artifact['coef'], artifact['intercept'], artifact['scaler_mean'], artifact['scaler_scale'],
+        feature_cols=artifact['feature_order'], scaled_cols=artifact['scaled_features'],
+    )
+
+
+def load_artifact(path):
+    with open(path) as file:
+        return predictor_from_dict(json.load(file))
+
+
+def compile_model(model, scaler):
+    """Serving predictor for a fitted model: linear, tree/forest or k-nearest neighbours."""
+    if hasattr(model, 'coef_'):
+        return CompiledPredictor.from_sklearn(model, scaler)
+    # Only reached for unpickled models, so scikit-learn is already imported
+    from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+    from sklearn.neighbors import KNeighborsRegressor
+    from sklearn.tree import BaseDecisionTree
+
+    if isinstance(model, (BaseDecisionTree, RandomForestRegressor, ExtraTreesRegressor)):
+        from compiled_models import CompiledTrees
+        return CompiledTrees.from_sklearn(model, scaler)
+    if isinstance(model, KNeighborsRegressor):
+        from compiled_models import CompiledNeighbors
+        return CompiledNeighbors.from_sklearn(model, scaler)
+    raise TypeError(f"Unsupported model type: {type(model).__name__}")
+
+
+def load_predictor(model_path='linear_regression_model.pkl', scaler_path='scaler.pkl'):
+    """Predictor from a JSON artifact, or compiled from the model/scaler pickles."""
+    if model_path.endswith('.json'):
+        return load_artifact(model_path)
+    with open(model_path, 'rb') as file:
+        model = pickle.load(file)
+    with open(scaler_path, 'rb') as file:
+        scaler = pickle.load(file)
+    return compile_model(model, scaler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the fitted model/scaler pickles to a JSON artifact.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export')
+    export.add_argument('model', help="Pickled LinearRegression")
+    export.add_argument('scaler', help="Pickled StandardScaler")
+    export.add_argument('output', help="Destination .json artifact")
+    args = parser.parse_args(argv)
+
+    with open(args.model, 'rb') as file:
+        model = pickle.load(file)
+    with open(args.scaler, 'rb') as file:
+        scaler = pickle.load(file)
+    export_artifact(model, scaler, args.output)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
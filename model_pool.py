@@ -0,0 +1,177 @@
+"""Per-tenant (e.g. per school district) models served side by side.
+
+Layout:
+    tenants/
+        district-a/         # a model registry (CURRENT + vNNNN/), hot-reloaded
+        district-b/
+            model.json      # or a plain artifact / model.pkl + scaler.pkl pair
+
+The "default" tenant is the dashboard's usual model (registry, then the
+bundled artifact). Tenants are loaded lazily on first use and kept in a
+bounded LRU, so hundreds of tenants fit in fixed memory. Tenants whose
+model and scaler parameters are identical share one predictor
+object. Load and predict latencies are recorded per tenant. The first
+load and every hot swap are counted as loads. When a tenant is evicted
+its metrics are dropped, and the pool's eviction listeners are called
+so per-tenant state held elsewhere can be dropped too.
+"""
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from instrumentation import MetricsRegistry
+from model_registry import (ARTIFACT_FILE, MODEL_FILE, SCALER_FILE, LoadedModel, ModelHandle, ModelRegistry,
+                            default_handle)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = 'default'
+DEFAULT_TENANTS_DIR = 'tenants'
+DEFAULT_MAX_TENANTS = 64
+TENANT_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$')
+
+
+class UnknownTenant(LookupError):
+    pass
+
+
+class _Entry:
+    def __init__(self, handle):
+        self.handle = handle
+        self.source = None  # the handle's LoadedModel behind loaded
+        self.loaded = None
+
+
+class ModelPool:
+    """Thread-safe LRU of per-tenant ModelHandles."""
+
+    def __init__(self, root=DEFAULT_TENANTS_DIR, max_tenants=DEFAULT_MAX_TENANTS, default=None,
+                 check_interval=2.0, metrics=None):
+        self.root = root
+        self.max_tenants = max_tenants
+        self.check_interval = check_interval
+        self.metrics = metrics or MetricsRegistry()
+        self._default = default
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Identical parameters across tenants resolve to one shared predictor
+        self._interned = weakref.WeakValueDictionary()
+        self._eviction_listeners = []
+        self.loads = self.evictions = 0
+
+    def add_eviction_listener(self, callback):
+        """Call callback(tenant) whenever a tenant is evicted from the pool."""
+        self._eviction_listeners.append(callback)
+
+    def _make_handle(self, tenant):
+        if tenant == DEFAULT_TENANT:
+            return self._default or default_handle()
+        directory = os.path.join(self.root, tenant)
+        if not os.path.isdir(directory):
+            raise UnknownTenant(f"Unknown tenant: {tenant}")
+        if os.path.exists(os.path.join(directory, ARTIFACT_FILE)):
+            fallback = (os.path.join(directory, ARTIFACT_FILE),)
+        else:
+            fallback = (os.path.join(directory, MODEL_FILE), os.path.join(directory, SCALER_FILE))
+        return ModelHandle(ModelRegistry(directory), fallback=fallback, check_interval=self.check_interval)
+
+    def _entry(self, tenant):
+        evicted = []
+        with self._lock:
+            entry = self._entries.get(tenant)
+            if entry is not None:
+                self._entries.move_to_end(tenant)
+                return entry
+            entry = self._entries[tenant] = _Entry(self._make_handle(tenant))
+            while len(self._entries) > self.max_tenants:
+                evicted.append(self._entries.popitem(last=False)[0])
+                self.evictions += 1
+        for name in evicted:
+            self._evicted(name)
+        return entry
+
+    def _evicted(self, tenant):
+        self.metrics.discard(tenant + '/')
+        for callback in self._eviction_listeners:
+            try:
+                callback(tenant)
+            except Exception:
+                logger.exception("Eviction listener failed for tenant %s", tenant)
+
+    def _intern(self, loaded):
+        """loaded, or a LoadedModel of the same version sharing an identical predictor."""
+        weights = getattr(loaded.predictor, 'weights', None)
+        if weights is None:
+            return loaded
+        key = (type(loaded.predictor), weights.tobytes(), loaded.predictor.intercept)
+        with self._lock:
+            predictor = self._interned.setdefault(key, loaded.predictor)
+        if predictor is loaded.predictor:
+            return loaded
+        return LoadedModel(loaded.version, predictor, loaded.source_paths, loaded.load_ms)
+
+    def get(self, tenant=None):
+        """LoadedModel for tenant (DEFAULT_TENANT when None), loading it on first use."""
+        tenant = tenant or DEFAULT_TENANT
+        if not TENANT_PATTERN.match(tenant):
+            raise UnknownTenant(f"Invalid tenant name: {tenant!r}")
+        entry = self._entry(tenant)
+        source = entry.handle.get()
+        if source is not entry.source:
+            # First load or a hot-swapped version, which the handle loaded in the background
+            if source.load_ms is not None:
+                self.metrics.record(f'{tenant}/load', source.load_ms)
+            entry.loaded = self._intern(source)
+            entry.source = source
+            self.loads += 1
+        return entry.loaded
+
+    def is_loaded(self, tenant=None):
+        """Whether tenant is resident with a model, so get() will not load one in the caller."""
+        with self._lock:
+            entry = self._entries.get(tenant or DEFAULT_TENANT)
+        return entry is not None and entry.loaded is not None
+
+    def predict(self, tenant, X):
+        """(scores, model version) for rows X, timed under the tenant's predict metric."""
+        loaded = self.get(tenant)
+        start = time.perf_counter()
+        scores = loaded.predictor.predict(X)
+        self.metrics.record(f'{tenant or DEFAULT_TENANT}/predict', (time.perf_counter() - start) * 1000)
+        return scores, loaded.version
+
+    def predict_one(self, tenant, *features):
+        """(score, model version) for one student, timed like predict()."""
+        loaded = self.get(tenant)
+        start = time.perf_counter()
+        score = loaded.predictor.predict_one(*features)
+        self.metrics.record(f'{tenant or DEFAULT_TENANT}/predict', (time.perf_counter() - start) * 1000)
+        return score, loaded.version
+
+    def available(self):
+        """DEFAULT_TENANT plus every tenant directory under root, loaded or not."""
+        names = []
+        if os.path.isdir(self.root):
+            names = sorted(name for name in os.listdir(self.root)
+                           if TENANT_PATTERN.match(name) and os.path.isdir(os.path.join(self.root, name)))
+        return [DEFAULT_TENANT] + [name for name in names if name != DEFAULT_TENANT]
+
+    def stats(self):
+        """Pool counters plus per-tenant latency summaries from the metrics registry."""
+        per_tenant = {}
+        for name, summary in self.metrics.snapshot()['stages'].items():
+            tenant, _, kind = name.rpartition('/')
+            per_tenant.setdefault(tenant, {})[kind] = summary
+        with self._lock:
+            return {
+                'resident': list(self._entries),
+                'max_tenants': self.max_tenants,
+                'loads': self.loads,
+                'evictions': self.evictions,
+                'shared_predictors': len(self._interned),
+                'tenants': per_tenant,
+            }
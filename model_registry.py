@@ -0,0 +1,277 @@
+"""Versioned on-disk model registry with hot reload.
+
+Layout:
+    models/
+        CURRENT             # name of the active version, replaced atomically
+        v0001/
+            model.pkl
+            scaler.pkl
+            model.json      # pickle-free artifact, used for serving when present
+            manifest.json   # version, creation time and SHA-256 of every file
+
+Usage:
+    python model_registry.py publish artifacts/model.pkl artifacts/scaler.pkl
+    python model_registry.py list
+    python model_registry.py activate v0001
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+from model_artifact import export_artifact, load_predictor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_DIR = 'models'
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+MODEL_FILE = 'model.pkl'
+SCALER_FILE = 'scaler.pkl'
+ARTIFACT_FILE = 'model.json'
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class LoadedModel:
+    """One immutable, fully loaded model version.
+
+    load_ms is how long loading (and compiling) it took, when known.
+    """
+
+    def __init__(self, version, predictor, source_paths, load_ms=None):
+        self.version = version
+        self.predictor = predictor
+        self.source_paths = tuple(source_paths)
+        self.load_ms = load_ms
+
+    @classmethod
+    def from_paths(cls, version, paths, started=None):
+        """Load a JSON artifact (one path) or a model/scaler pickle pair.
+
+        started: perf_counter() value load_ms is measured from, if earlier than now.
+        """
+        started = time.perf_counter() if started is None else started
+        predictor = load_predictor(*paths)
+        return cls(version, predictor, paths, (time.perf_counter() - started) * 1000)
+
+
+class ModelRegistry:
+    def __init__(self, root=DEFAULT_REGISTRY_DIR):
+        self.root = root
+
+    @property
+    def current_path(self):
+        return os.path.join(self.root, CURRENT_FILE)
+
+    def versions(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if os.path.isfile(os.path.join(self.root, name, MANIFEST_FILE)))
+
+    def current_version(self):
+        try:
+            with open(self.current_path) as file:
+                return file.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def manifest(self, version):
+        with open(os.path.join(self.root, version, MANIFEST_FILE)) as file:
+            return json.load(file)
+
+    def publish(self, model_path, scaler_path, activate=True):
+        """Copy a model/scaler pair in as a new version; returns the version name."""
+        os.makedirs(self.root, exist_ok=True)
+        # Stage everything in a temp dir on the same filesystem, then rename
+        # it into place so readers never see a partially written version.
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.root)
+        try:
+            shutil.copyfile(model_path, os.path.join(staging, MODEL_FILE))
+            shutil.copyfile(scaler_path, os.path.join(staging, SCALER_FILE))
+            names = [MODEL_FILE, SCALER_FILE]
+            # Linear models also get a pickle-free artifact for serving
+            with open(model_path, 'rb') as file:
+                model = pickle.load(file)
+            if hasattr(model, 'coef_'):
+                with open(scaler_path, 'rb') as file:
+                    scaler = pickle.load(file)
+                export_artifact(model, scaler, os.path.join(staging, ARTIFACT_FILE))
+                names.append(ARTIFACT_FILE)
+            files = {name: file_sha256(os.path.join(staging, name)) for name in names}
+
+            existing = self.versions()
+            number = int(existing[-1][1:]) + 1 if existing else 1
+            version = f"v{number:04d}"
+            manifest = {
+                'version': version,
+                'created': datetime.now(timezone.utc).isoformat(),
+                'files': files,
+            }
+            with open(os.path.join(staging, MANIFEST_FILE), 'w') as file:
+                json.dump(manifest, file, indent=2)
+            os.rename(staging, os.path.join(self.root, version))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if activate:
+            self.activate(version)
+        return version
+
+    def activate(self, version):
+        if version not in self.versions():
+            raise ValueError(f"Unknown model version: {version}")
+        tmp = self.current_path + '.tmp'
+        with open(tmp, 'w') as file:
+            file.write(version + '\n')
+        os.replace(tmp, self.current_path)
+
+    def load(self, version):
+        """Load a version after checking its files against the manifest hashes."""
+        started = time.perf_counter()
+        directory = os.path.join(self.root, version)
+        manifest = self.manifest(version)
+        for name, expected in manifest['files'].items():
+            if file_sha256(os.path.join(directory, name)) != expected:
+                raise ValueError(f"{version}/{name} does not match its manifest hash")
+        if ARTIFACT_FILE in manifest['files']:
+            paths = (os.path.join(directory, ARTIFACT_FILE),)
+        else:
+            paths = (os.path.join(directory, MODEL_FILE), os.path.join(directory, SCALER_FILE))
+        return LoadedModel.from_paths(version, paths, started)
+
+
+class ModelHandle:
+    """Serves the registry's active version and hot-swaps it when CURRENT changes.
+
+    get() costs one os.stat() at most every check_interval seconds. Only
+    the first load happens in the caller. A new version is loaded, and tree
+    or k-NN models compiled (seconds), in a background thread while get()
+    keeps returning the previous LoadedModel; the reference is swapped once
+    it is ready. If the registry is empty, the fallback paths (a JSON
+    artifact, or a model/scaler pickle pair) are served instead.
+    """
+
+    def __init__(self, registry, fallback=None, check_interval=2.0):
+        self.registry = registry
+        self.fallback = fallback
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._loaded = None
+        self._stamp = None
+        self._next_check = 0.0
+        self._swapping = False
+        self._failed_stamp = None  # CURRENT as it was when its version failed to load
+
+    def _current_stamp(self):
+        try:
+            stat = os.stat(self.registry.current_path)
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            return None
+
+    def _load_active(self):
+        version = self.registry.current_version()
+        if version is not None:
+            if self._loaded is not None and self._loaded.version == version:
+                return self._loaded
+            return self.registry.load(version)
+        if self.fallback is not None:
+            started = time.perf_counter()
+            return LoadedModel.from_paths('legacy-' + file_sha256(self.fallback[0])[:12], self.fallback, started)
+        return None
+
+    def _swap(self, stamp):
+        try:
+            loaded = self._load_active()
+        except Exception:
+            # Not retried, and so logged once, until CURRENT is rewritten
+            logger.exception("Failed to load model version %s; keeping %s until CURRENT changes",
+                             self.registry.current_version(), self._loaded.version)
+            loaded = None
+        with self._lock:
+            self._swapping = False
+            if loaded is None:
+                self._failed_stamp = stamp
+                return
+            if loaded is not self._loaded:
+                logger.info("Swapped model %s -> %s", self._loaded.version, loaded.version)
+            self._loaded = loaded
+            self._stamp = stamp
+
+    def get(self):
+        now = time.monotonic()
+        if self._loaded is not None and now < self._next_check:
+            return self._loaded
+
+        with self._lock:
+            if self._loaded is not None and now < self._next_check:
+                return self._loaded
+            self._next_check = now + self.check_interval
+            stamp = self._current_stamp()
+            if self._loaded is not None and stamp in (self._stamp, self._failed_stamp):
+                return self._loaded
+            if self._loaded is None:
+                # Nothing to serve yet, so the first load blocks the caller
+                self._loaded = self._load_active()
+                self._stamp = stamp
+                return self._loaded
+            if not self._swapping:
+                self._swapping = True
+                threading.Thread(target=self._swap, args=(stamp,), daemon=True).start()
+            return self._loaded
+
+
+def default_handle(registry_dir=DEFAULT_REGISTRY_DIR):
+    """Registry handle falling back to the bundled artifact, then the bundled pickles."""
+    if os.path.exists('linear_regression_model.json'):
+        fallback = ('linear_regression_model.json',)
+    else:
+        fallback = ('linear_regression_model.pkl', 'scaler.pkl')
+    return ModelHandle(ModelRegistry(registry_dir), fallback=fallback)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the versioned model registry.")
+    parser.add_argument('--root', default=DEFAULT_REGISTRY_DIR)
+    commands = parser.add_subparsers(dest='command', required=True)
+    publish = commands.add_parser('publish', help="Add a model/scaler pair as a new version")
+    publish.add_argument('model')
+    publish.add_argument('scaler')
+    publish.add_argument('--no-activate', action='store_true')
+    commands.add_parser('list', help="List versions")
+    activate = commands.add_parser('activate', help="Make an existing version active")
+    activate.add_argument('version')
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry(args.root)
+    if args.command == 'publish':
+        version = registry.publish(args.model, args.scaler, activate=not args.no_activate)
+        print(f"Published {version}" + ("" if args.no_activate else " (active)"))
+    elif args.command == 'list':
+        current = registry.current_version()
+        for version in registry.versions():
+            marker = '*' if version == current else ' '
+            print(f"{marker} {version}  {registry.manifest(version)['created']}")
+    elif args.command == 'activate':
+        registry.activate(args.version)
+        print(f"Activated {args.version}")
+
+
+if __name__ == '__main__':
+    main()
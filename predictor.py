@@ -0,0 +1,82 @@
+import numpy as np
+
+# Column order used by the notebook when fitting the model and the scaler
+FEATURE_COLS = ['Hours Studied', 'Previous Scores', 'Extracurricular Activities', 'Sleep Hours', 'Sample Question Papers Practiced']
+NUMERICAL_COLS = ['Hours Studied', 'Previous Scores', 'Sleep Hours', 'Sample Question Papers Practiced']
+
+# Yes/No encoding used for the extracurricular column in training
+EXTRACURRICULAR_MAP = {'Yes': 1, 'No': 0}
+
+# Performance level buckets, indexed by performance_level_code()
+PERFORMANCE_LEVELS = ['Needs Improvement', 'Average', 'Good', 'Excellent']
+LEVEL_THRESHOLDS = np.array([50.0, 70.0, 85.0])
+
+
+def performance_level_code(score):
+    """Bucket index into PERFORMANCE_LEVELS for a score or array of scores."""
+    return np.searchsorted(LEVEL_THRESHOLDS, score, side='right')
+
+
+def performance_level(score):
+    return PERFORMANCE_LEVELS[int(performance_level_code(score))]
+
+
+class CompiledPredictor:
+    """StandardScaler + LinearRegression folded into a single affine map.
+
+    The scaler's mean/scale are absorbed into the regression weights so a
+    prediction is one dot product over the raw (unscaled) feature vector,
+    in FEATURE_COLS order.
+    """
+
+    def __init__(self, weights, intercept):
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.intercept = float(intercept)
+        # Plain floats make the single-row path cheaper than a numpy call
+        self._weights_list = [float(w) for w in self.weights]
+
+    @classmethod
+    def from_params(cls, coef, intercept, mean, scale, feature_cols=FEATURE_COLS, scaled_cols=NUMERICAL_COLS):
+        """Fold raw LinearRegression coef/intercept and StandardScaler mean/scale."""
+        feature_cols = list(feature_cols)
+        scaled_cols = list(scaled_cols)
+        if feature_cols != FEATURE_COLS:
+            raise ValueError(f"Unexpected model features: {feature_cols}")
+
+        n_scaled = len(scaled_cols)
+        mean = np.asarray(mean, dtype=np.float64) if mean is not None else np.zeros(n_scaled)
+        scale = np.asarray(scale, dtype=np.float64) if scale is not None else np.ones(n_scaled)
+
+        coef = np.asarray(coef, dtype=np.float64).ravel()
+        weights = coef.copy()
+        intercept = float(np.ravel(intercept)[0])
+        for k, col in enumerate(scaled_cols):
+            j = feature_cols.index(col)
+            weights[j] = coef[j] / scale[k]
+            intercept -= coef[j] * mean[k] / scale[k]
+        return cls(weights, intercept)
+
+    @classmethod
+    def from_sklearn(cls, model, scaler):
+        return cls.from_params(
+            model.coef_, model.intercept_, scaler.mean_, scaler.scale_,
+            feature_cols=getattr(model, 'feature_names_in_', FEATURE_COLS),
+            scaled_cols=getattr(scaler, 'feature_names_in_', NUMERICAL_COLS),
+        )
+
+    def predict(self, X):
+        """Score an (N, 5) array or a single 5-element row."""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            return np.array([X @ self.weights + self.intercept])
+        return X @ self.weights + self.intercept
+
+    def predict_one(self, hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers):
+        w = self._weights_list
+        return (self.intercept
+                + w[0] * hours_studied
+                + w[1] * previous_scores
+                + w[2] * extracurricular
+                + w[3] * sleep_hours
+                + w[4] * sample_papers)
+
@@ -0,0 +1,119 @@
+"""Process-wide result cache shared by every dashboard session.
+
+Entries are keyed on the normalized sidebar inputs plus the model version
+and hold the fully computed result bundle of a rerun. The cache is a
+bounded LRU with a per-entry TTL. Each scope (e.g. a tenant) tracks its
+own model version; when a scope sees a new version, the entries computed
+by its old one are dropped.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from predictor import EXTRACURRICULAR_MAP
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL = 600.0
+
+
+def normalize_inputs(hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers):
+    """Canonical hashable key for one set of inputs.
+
+    Yes/No and bools become 1/0, and integral floats become ints, so
+    (5, 70, 'Yes', 7, 3) and (5.0, 70.0, 1, 7.0, 3.0) share an entry.
+    """
+    if isinstance(extracurricular, str):
+        extracurricular = EXTRACURRICULAR_MAP[extracurricular]
+
+    def canonical(value):
+        value = float(value)
+        return int(value) if value.is_integer() else value
+
+    return tuple(canonical(v) for v in (hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers))
+
+
+class ResultCache:
+    """Thread-safe bounded LRU + TTL map from (scope, inputs, model version) to results."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._versions = {}
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def _sync_version(self, scope, version):
+        # Called with the lock held
+        if scope not in self._versions:
+            self._versions[scope] = version
+        elif self._versions[scope] != version:
+            stale = [key for key in self._entries if key[0] == scope]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            self._versions[scope] = version
+
+    def get(self, inputs, version, scope=None):
+        """Cached value or None; counts a hit or a miss."""
+        key = (scope, inputs)
+        with self._lock:
+            self._sync_version(scope, version)
+            entry = self._entries.get(key)
+            if entry is not None and self.clock() >= entry[0]:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, inputs, version, value, scope=None):
+        key = (scope, inputs)
+        with self._lock:
+            self._sync_version(scope, version)
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, inputs, version, compute, scope=None):
+        """Cached value for (inputs, version) in scope, computing and storing it on a miss.
+
+        compute() runs outside the lock, so two sessions missing on the
+        same key at once may both compute it; the results are identical.
+        """
+        value = self.get(inputs, version, scope)
+        if value is None:
+            value = compute()
+            self.put(inputs, version, value, scope)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl_s': self.ttl,
+                'scopes': len(self._versions),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+
+RESULTS = ResultCache()
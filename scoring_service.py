@@ -0,0 +1,359 @@
+"""Standalone HTTP scoring service for machine-to-machine integrations.
+
+Usage:
+    python scoring_service.py --port 8000 --window-ms 2
+    python scoring_service.py --tenants-dir tenants --max-tenants 200
+
+Endpoints (JSON in, JSON out):
+    GET  /health
+    GET  /drift                input/prediction drift per tenant@version (?tenant= to filter)
+    POST /predict              one student
+    POST /predict/batch        {"students": [...]}
+    POST /recommendations      one student, or {"students": [...]}
+
+A student is {"hours_studied", "previous_scores", "extracurricular",
+"sleep_hours", "sample_papers"}; extracurricular accepts "Yes"/"No" or 1/0.
+The model is chosen per request by a "tenant" field in the body or a
+?tenant= query parameter (see model_pool.py); it defaults to "default".
+
+Concurrent single predictions for the same tenant that arrive within
+--window-ms are coalesced into one vectorized predict call.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from drift_monitor import DriftMonitors
+from model_pool import DEFAULT_MAX_TENANTS, DEFAULT_TENANT, DEFAULT_TENANTS_DIR, ModelPool, UnknownTenant
+from model_registry import DEFAULT_REGISTRY_DIR, default_handle
+from predictor import EXTRACURRICULAR_MAP, PERFORMANCE_LEVELS, performance_level_code
+from study_advisor import StudyAdvisor
+
+logger = logging.getLogger(__name__)
+
+STUDENT_FIELDS = ('hours_studied', 'previous_scores', 'extracurricular', 'sleep_hours', 'sample_papers')
+MAX_BODY_BYTES = 16 * 2**20
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class BadRequest(Exception):
+    pass
+
+
+def parse_student(payload):
+    """Feature row in FEATURE_COLS order from a request dict."""
+    if not isinstance(payload, dict):
+        raise BadRequest("Each student must be a JSON object")
+    row = []
+    for field in STUDENT_FIELDS:
+        if field not in payload:
+            raise BadRequest(f"Missing field: {field}")
+        value = payload[field]
+        if field == 'extracurricular' and isinstance(value, str):
+            if value not in EXTRACURRICULAR_MAP:
+                raise BadRequest("extracurricular must be 'Yes' or 'No'")
+            value = EXTRACURRICULAR_MAP[value]
+        if isinstance(value, bool):
+            value = int(value)
+        if not isinstance(value, (int, float)):
+            raise BadRequest(f"{field} must be a number")
+        try:
+            value = float(value)
+        except OverflowError:
+            value = math.inf
+        # json.loads accepts NaN and Infinity, which would score as NaN
+        if not math.isfinite(value):
+            raise BadRequest(f"{field} must be a finite number")
+        row.append(value)
+    return row
+
+
+def parse_students(payload):
+    students = payload.get('students') if isinstance(payload, dict) else None
+    if not isinstance(students, list):
+        raise BadRequest("Expected {\"students\": [...]}")
+    return np.array([parse_student(s) for s in students], dtype=np.float64).reshape(-1, len(STUDENT_FIELDS))
+
+
+def request_tenant(payload, query):
+    """Tenant named by the body's "tenant" field, else ?tenant=, else the default."""
+    tenant = payload.get('tenant') if isinstance(payload, dict) else None
+    if tenant is None:
+        tenant = parse_qs(query).get('tenant', [DEFAULT_TENANT])[0]
+    if not isinstance(tenant, str):
+        raise BadRequest("tenant must be a string")
+    return tenant
+
+
+class MicroBatcher:
+    """Coalesces single-row predictions arriving within a short window.
+
+    predict(X) must return (scores, model version).
+    """
+
+    def __init__(self, predict, window=0.002, max_batch=256):
+        self.predict = predict
+        self.window = window
+        self.max_batch = max_batch
+        self._rows = []
+        self._futures = []
+        self._timer = None
+        self.batches = 0
+        self.rows = 0
+
+    def submit(self, row):
+        future = asyncio.get_running_loop().create_future()
+        self._rows.append(row)
+        self._futures.append(future)
+        if len(self._rows) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        rows, futures = self._rows, self._futures
+        self._rows, self._futures = [], []
+        if not rows:
+            return
+        try:
+            scores, version = self.predict(np.array(rows, dtype=np.float64))
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.batches += 1
+        self.rows += len(rows)
+        for future, score in zip(futures, scores):
+            if not future.done():
+                future.set_result((float(score), version))
+
+
+def _prediction(score, version):
+    return {
+        'predicted_score': score,
+        'performance_level': PERFORMANCE_LEVELS[int(performance_level_code(score))],
+        'model_version': version,
+    }
+
+
+class ScoringService:
+    def __init__(self, pool, window=0.002, max_batch=256, monitors=None):
+        self.pool = pool
+        self.window = window
+        self.max_batch = max_batch
+        self.monitors = monitors
+        self.batchers = {}
+        pool.add_eviction_listener(self._evicted)
+
+    def _evicted(self, tenant):
+        # A removed batcher still flushes the rows it already holds
+        self.batchers.pop(tenant, None)
+        if self.monitors is not None:
+            self.monitors.discard(tenant)
+
+    def _predict(self, tenant, X):
+        if self.monitors is None:
+            return self.pool.predict(tenant, X)
+        loaded = self.pool.get(tenant)
+        scores, version = self.pool.predict(tenant, X)
+        if version == loaded.version:
+            self.monitors.get(tenant or DEFAULT_TENANT, loaded).record_batch(X, scores)
+        return scores, version
+
+    def batcher(self, tenant):
+        batcher = self.batchers.get(tenant)
+        if batcher is None:
+            self.pool.get(tenant)  # unknown tenants fail here, before anything is queued
+            batcher = self.batchers[tenant] = MicroBatcher(
+                lambda X: self._predict(tenant, X), self.window, self.max_batch)
+        return batcher
+
+    async def predict(self, payload, tenant):
+        row = parse_student(payload)
+        score, version = await self.batcher(tenant).submit(row)
+        return _prediction(score, version)
+
+    async def predict_batch(self, payload, tenant):
+        X = parse_students(payload)
+        scores, version = self._predict(tenant, X)
+        return {'predictions': [_prediction(float(s), version) for s in scores]}
+
+    async def recommendations(self, payload, tenant):
+        batch = isinstance(payload, dict) and 'students' in payload
+        if batch:
+            X = parse_students(payload)
+            scores, version = self._predict(tenant, X)
+        else:
+            row = parse_student(payload)
+            score, version = await self.batcher(tenant).submit(row)
+            X, scores = np.array([row]), np.array([score])
+
+        advice = StudyAdvisor.get_batch_recommendations(*X.T, scores)
+        results = []
+        for i, score in enumerate(scores):
+            recommendations, insights, mentoring_plan = advice.expand(i)
+            result = _prediction(float(score), version)
+            result.update(recommendations=recommendations, insights=insights, mentoring_plan=mentoring_plan)
+            results.append(result)
+        return {'students': results} if batch else results[0]
+
+    def health(self):
+        pool = self.pool.stats()
+        return {
+            'status': 'ok',
+            'model_version': self.pool.get(DEFAULT_TENANT).version,
+            'batches': sum(b.batches for b in self.batchers.values()),
+            'batched_rows': sum(b.rows for b in self.batchers.values()),
+            'tenants': {
+                'resident': pool['resident'],
+                'loads': pool['loads'],
+                'evictions': pool['evictions'],
+                'shared_predictors': pool['shared_predictors'],
+                'latency_ms': {
+                    tenant: {kind: {'count': s['count'], 'p50': s['p50_ms'], 'p99': s['p99_ms']}
+                             for kind, s in kinds.items()}
+                    for tenant, kinds in pool['tenants'].items()
+                },
+            },
+        }
+
+    async def dispatch(self, method, path, body, query=''):
+        if path == '/health':
+            if method != 'GET':
+                return 405, {'error': 'Use GET'}
+            return 200, self.health()
+        if path == '/drift':
+            if method != 'GET':
+                return 405, {'error': 'Use GET'}
+            if self.monitors is None:
+                return 404, {'error': 'Drift monitoring is disabled'}
+            return 200, self.monitors.report(parse_qs(query).get('tenant', [None])[0])
+
+        routes = {
+            '/predict': self.predict,
+            '/predict/batch': self.predict_batch,
+            '/recommendations': self.recommendations,
+        }
+        if path not in routes:
+            return 404, {'error': f"No route for {path}"}
+        if method != 'POST':
+            return 405, {'error': 'Use POST'}
+        try:
+            payload = json.loads(body or b'null')
+            tenant = request_tenant(payload, query)
+            if not self.pool.is_loaded(tenant):
+                # A tenant's first load, which may compile a tree or k-NN model, runs off the event loop
+                await asyncio.get_running_loop().run_in_executor(None, self.pool.get, tenant)
+            return 200, await routes[path](payload, tenant)
+        except UnknownTenant as exc:
+            return 404, {'error': str(exc)}
+        except (BadRequest, ValueError) as exc:
+            return 400, {'error': str(exc)}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Malformed request line'}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # The body cannot be framed, so the connection cannot be reused
+                    await self._respond(writer, 400, {'error': 'Invalid Content-Length'}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': 'Request body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                try:
+                    path, _, query = target.partition('?')
+                    status, payload = await self.dispatch(method, path, body, query)
+                except Exception:
+                    logger.exception("Unhandled error for %s %s", method, target)
+                    status, payload = 500, {'error': 'Internal server error'}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8000, window=0.002, max_batch=256, pool=None, monitors=None):
+    service = ScoringService(pool or ModelPool(), window, max_batch, monitors)
+    service.pool.get(DEFAULT_TENANT)  # fail fast if no model can be loaded
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    logger.info("Scoring service listening on http://%s:%d", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP scoring service for the student performance model.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window-ms', type=float, default=2.0, help="Micro-batching window")
+    parser.add_argument('--max-batch', type=int, default=256, help="Flush a micro-batch once it reaches this size")
+    parser.add_argument('--registry', default=os.environ.get('STUDENT_MODEL_REGISTRY', DEFAULT_REGISTRY_DIR),
+                        help="Registry of the default tenant")
+    parser.add_argument('--tenants-dir', default=os.environ.get('STUDENT_TENANTS_DIR', DEFAULT_TENANTS_DIR))
+    parser.add_argument('--max-tenants', type=int, default=DEFAULT_MAX_TENANTS,
+                        help="Tenants kept loaded at once (least recently used are evicted)")
+    parser.add_argument('--no-drift', action='store_true', help="Disable input/prediction drift monitoring")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    try:
+        pool = ModelPool(args.tenants_dir, args.max_tenants, default=default_handle(args.registry))
+        # The drift reference is loaded here, before serving, never inside a request
+        monitors = None if args.no_drift else DriftMonitors()
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1000, args.max_batch, pool, monitors))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
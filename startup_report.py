@@ -0,0 +1,150 @@
+"""Cold-start report for the Streamlit dashboard.
+
+Usage:
+    python startup_report.py                          # student_dashboard.py
+    python startup_report.py --rev HEAD~1 --runs 5    # compare with an earlier revision
+    python startup_report.py --scripts old_dashboard.py student_dashboard.py
+
+Every measurement runs in a fresh interpreter, as on a new replica:
+  * import: time spent in the script's top-level imports (after streamlit
+    itself, which every version pays for equally), with the slowest ones;
+  * first run: wall time of the first script run under streamlit's AppTest,
+    plus the profiler's first_paint (metrics row on screen) and total stages.
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DEFAULT_SCRIPT = 'student_dashboard.py'
+
+_IMPORT_PROBE = r'''
+import json, sys, time
+import streamlit
+timings = []
+for statement in json.loads(sys.argv[1]):
+    start = time.perf_counter()
+    exec(statement, {})
+    timings.append((statement, (time.perf_counter() - start) * 1000))
+print(json.dumps(timings))
+'''
+
+_RUN_PROBE = r'''
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=300)
+start = time.perf_counter()
+app.run()
+print(json.dumps({'run_ms': (time.perf_counter() - start) * 1000, 'exceptions': [e.value for e in app.exception]}))
+'''
+
+
+def top_level_imports(script):
+    """Source of each module-level import statement in script, except streamlit's."""
+    with open(script) as file:
+        source = file.read()
+    statements = []
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            text = ast.get_source_segment(source, node)
+            if not text.startswith('import streamlit'):
+                statements.append(text)
+    return statements
+
+
+def _probe(code, args, env=None):
+    result = subprocess.run([sys.executable, '-c', code, *args], capture_output=True, text=True,
+                            cwd=os.getcwd(), env=env, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_imports(script):
+    timings = _probe(_IMPORT_PROBE, [json.dumps(top_level_imports(script))])
+    return {'import_ms': sum(ms for _, ms in timings),
+            'slowest': sorted(timings, key=lambda t: -t[1])[:3]}
+
+
+def measure_first_run(script):
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics_path = os.path.join(tmp, 'metrics.json')
+        env = dict(os.environ, STUDENT_DASHBOARD_PROFILE='1', STUDENT_DASHBOARD_METRICS_FILE=metrics_path,
+                   PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get('PYTHONPATH')])))
+        run = _probe(_RUN_PROBE, [script], env)
+        stages = {}
+        if os.path.exists(metrics_path):
+            with open(metrics_path) as file:
+                stages = {name: s['max_ms'] for name, s in json.load(file)['stages'].items()}
+    if run['exceptions']:
+        raise RuntimeError(f"{script} raised: {run['exceptions']}")
+    return {'run_ms': run['run_ms'], 'first_paint_ms': stages.get('first_paint'), 'total_ms': stages.get('total')}
+
+
+def report(script, runs):
+    samples = [dict(measure_imports(script), **measure_first_run(script)) for _ in range(runs)]
+
+    def median(key):
+        values = [s[key] for s in samples if s[key] is not None]
+        return statistics.median(values) if values else None
+
+    return {
+        'script': script,
+        'runs': runs,
+        'import_ms': median('import_ms'),
+        'first_run_ms': median('run_ms'),
+        'first_paint_ms': median('first_paint_ms'),
+        'total_ms': median('total_ms'),
+        'slowest_imports': samples[-1]['slowest'],
+    }
+
+
+def _fmt(value):
+    return f"{value:>12.1f}" if value is not None else f"{'-':>12}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure dashboard cold-start time in fresh interpreters.")
+    parser.add_argument('--scripts', nargs='+', default=[DEFAULT_SCRIPT])
+    parser.add_argument('--rev', action='append', default=[],
+                        help=f"Also measure {DEFAULT_SCRIPT} as of this git revision (repeatable)")
+    parser.add_argument('--runs', type=int, default=3, help="Fresh-process samples per script (median reported)")
+    parser.add_argument('--json', action='store_true', help="Print the raw report as JSON")
+    args = parser.parse_args(argv)
+
+    scripts, temporary = [], []
+    try:
+        for rev in args.rev:
+            source = subprocess.run(['git', 'show', f'{rev}:{DEFAULT_SCRIPT}'], capture_output=True, text=True,
+                                    check=True).stdout
+            # Kept next to the current modules so its imports resolve
+            path = f".startup_{rev.replace('~', '_').replace('^', '_').replace('/', '_')}.py"
+            with open(path, 'w') as file:
+                file.write(source)
+            temporary.append(path)
+            scripts.append(path)
+        scripts += args.scripts
+
+        results = [report(script, args.runs) for script in scripts]
+    finally:
+        for path in temporary:
+            os.remove(path)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'Script':<32}{'Imports':>12}{'First paint':>12}{'Run total':>12}{'AppTest run':>12}   (ms, median of {args.runs})")
+    for r in results:
+        print(f"{r['script']:<32}{_fmt(r['import_ms'])}{_fmt(r['first_paint_ms'])}{_fmt(r['total_ms'])}"
+              f"{_fmt(r['first_run_ms'])}")
+    for r in results:
+        slowest = ', '.join(f"{statement.split(' import')[0]} {ms:.0f}" for statement, ms in r['slowest_imports'])
+        print(f"  {r['script']}: slowest imports: {slowest}")
+
+
+if __name__ == '__main__':
+    main()
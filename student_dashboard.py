@@ -1,10 +1,13 @@
 import streamlit as st
-import pickle
-import numpy as np
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+import os
 from datetime import datetime
+from predictor import performance_level
+from model_registry import DEFAULT_REGISTRY_DIR, default_handle
+from model_pool import DEFAULT_MAX_TENANTS, DEFAULT_TENANT, DEFAULT_TENANTS_DIR, ModelPool, UnknownTenant
+from study_advisor import StudyAdvisor, sort_by_priority
+from instrumentation import RunProfiler, profiling_enabled, render_admin_panel
+from result_cache import RESULTS, normalize_inputs
+from drift_monitor import DriftMonitors, render_drift_panel
 
 # Page configuration
 st.set_page_config(
@@ -14,238 +17,128 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Opt-in per-stage timing (STUDENT_DASHBOARD_PROFILE=1 or ?profile=1)
+profiler = RunProfiler(profiling_enabled(st.query_params))
+
 # Custom CSS - BLACK TEXT FOR PERFECT VISIBILITY
-st.markdown("""
-<style>
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .stApp {
-        background: transparent;
-    }
-    .metric-card {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        border-radius: 15px;
-        padding: 20px;
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-    }
-    .recommendation-box {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-        color: black !important;  /* FIXED: Black text */
-        font-weight: 500;
-    }
-    .insight-box {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-        color: black !important;  /* FIXED: Black text */
-    }
-    h1, h2, h3 {
-        color: black !important;  /* FIXED: Black headers */
-    }
-    .stMetric label {
-        color: black !important;  /* FIXED: Metric labels */
-    }
-    .stMetric .css-1xarl3l {
-        color: black !important;  /* FIXED: Metric values */
-    }
-    /* FIXED: All text elements */
-    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, 
-    .stMarkdown p, .stMarkdown li, .stMarkdown td {
-        color: black !important;
-    }
-    /* FIXED: Sidebar text */
-    .css-1d391kg {
-        color: black !important;
-    }
-    /* FIXED: Dataframe text */
-    .dataframe tbody td {
-        color: black !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+with profiler.stage('css'):
+    st.markdown("""
+    <style>
+        .main {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .stApp {
+            background: transparent;
+        }
+        .metric-card {
+            background: rgba(255, 255, 255, 0.1);
+            backdrop-filter: blur(10px);
+            border-radius: 15px;
+            padding: 20px;
+            border: 1px solid rgba(255, 255, 255, 0.2);
+            box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
+        }
+        .recommendation-box {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            border-radius: 10px;
+            padding: 15px;
+            margin: 10px 0;
+            color: black !important;  /* FIXED: Black text */
+            font-weight: 500;
+        }
+        .insight-box {
+            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+            border-radius: 10px;
+            padding: 15px;
+            margin: 10px 0;
+            color: black !important;  /* FIXED: Black text */
+        }
+        h1, h2, h3 {
+            color: black !important;  /* FIXED: Black headers */
+        }
+        .stMetric label {
+            color: black !important;  /* FIXED: Metric labels */
+        }
+        .stMetric .css-1xarl3l {
+            color: black !important;  /* FIXED: Metric values */
+        }
+        /* FIXED: All text elements */
+        .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, 
+        .stMarkdown p, .stMarkdown li, .stMarkdown td {
+            color: black !important;
+        }
+        /* FIXED: Sidebar text */
+        .css-1d391kg {
+            color: black !important;
+        }
+        /* FIXED: Dataframe text */
+        .dataframe tbody td {
+            color: black !important;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
-st.markdown("""
-<style>
-    [data-testid="stAppViewContainer"] {
-        background: linear-gradient(135deg, #f5f5f5 0%, #e0e0e0 50%, #d0d0d0 100%);
-    }
-    .main .block-container {
-        background: transparent;
-        padding-top: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+    st.markdown("""
+    <style>
+        [data-testid="stAppViewContainer"] {
+            background: linear-gradient(135deg, #f5f5f5 0%, #e0e0e0 50%, #d0d0d0 100%);
+        }
+        .main .block-container {
+            background: transparent;
+            padding-top: 1rem;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
 
-# Load model and scaler
+# Optional table mode: answer from a precomputed grid of every sidebar input
+TABLE_MODE = os.environ.get('STUDENT_TABLE_MODE', '').lower() in ('1', 'true', 'yes')
+
+# Load model and scaler: every school district (tenant) is served from its own
+# versioned registry or artifact, loaded on first use and kept in a bounded pool.
+# The "default" tenant is the registry, else the fixed artifact/pickles. Handles
+# are shared by every session and swap in newly activated versions without a restart.
 @st.cache_resource
-def load_model():
+def load_model_pool():
+    return ModelPool(
+        os.environ.get('STUDENT_TENANTS_DIR', DEFAULT_TENANTS_DIR),
+        int(os.environ.get('STUDENT_MAX_TENANTS', DEFAULT_MAX_TENANTS)),
+        default=default_handle(os.environ.get('STUDENT_MODEL_REGISTRY', DEFAULT_REGISTRY_DIR)),
+    )
+
+@st.cache_resource(max_entries=DEFAULT_MAX_TENANTS)
+def load_prediction_table(tenant, version, _loaded):
+    from lookup_table import load_or_build
+    return load_or_build(_loaded.predictor.predict, _loaded.source_paths)
+
+@st.cache_resource
+def load_drift_monitors():
+    # Process-wide, one monitor per (tenant, version), dropped with evicted tenants
+    monitors = DriftMonitors()
+    load_model_pool().add_eviction_listener(monitors.discard)
+    return monitors
+
+model_pool = load_model_pool()
+
+# Tenant from ?tenant=..., switchable in the sidebar when several are deployed
+tenants = model_pool.available()
+tenant = st.query_params.get('tenant', DEFAULT_TENANT)
+if len(tenants) > 1:
+    tenant = st.sidebar.selectbox('🏫 School District', tenants,
+                                  index=tenants.index(tenant) if tenant in tenants else 0)
+
+with profiler.stage('load_model'):
     try:
-        with open('linear_regression_model.pkl', 'rb') as file:
-            model = pickle.load(file)
-        with open('scaler.pkl', 'rb') as file:
-            scaler = pickle.load(file)
-        return model, scaler
-    except:
+        loaded_model = model_pool.get(tenant)
+    except UnknownTenant as exc:
+        loaded_model = None
+        st.error(f"⚠️ {exc}")
+    except Exception:
+        loaded_model = None
         st.error("⚠️ Model files not found. Please ensure 'linear_regression_model.pkl' and 'scaler.pkl' are in the directory.")
-        return None, None
 
-model, scaler = load_model()
-
-# AI-Powered Recommendation Engine
-class StudyAdvisor:
-    @staticmethod
-    def get_study_recommendations(hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers, predicted_score):
-        recommendations = []
-        insights = []
-        mentoring_plan = []
-        
-        # Study Hours Analysis
-        if hours_studied < 3:
-            recommendations.append({
-                "category": "📚 Study Time",
-                "priority": "HIGH",
-                "message": "Increase study hours to 4-6 hours daily",
-                "action": "Create a structured study schedule with 25-min focused sessions (Pomodoro Technique)",
-                "impact": "+15-20 points potential"
-            })
-            mentoring_plan.append("Weekly check-ins to monitor study schedule adherence")
-        elif hours_studied < 5:
-            recommendations.append({
-                "category": "📚 Study Time",
-                "priority": "MEDIUM",
-                "message": "Good study habits! Optimize for quality over quantity",
-                "action": "Focus on active recall and spaced repetition techniques",
-                "impact": "+10-15 points potential"
-            })
-        else:
-            insights.append("✅ Excellent study time commitment! Maintain this consistency.")
-        
-        # Previous Scores Analysis
-        if previous_scores < 50:
-            recommendations.append({
-                "category": "📈 Foundation Building",
-                "priority": "CRITICAL",
-                "message": "Focus on strengthening fundamental concepts",
-                "action": "1. Daily concept review sessions\n2. One-on-one tutoring\n3. Start with easier topics to build confidence",
-                "impact": "+20-30 points potential"
-            })
-            mentoring_plan.append("Bi-weekly personalized tutoring sessions focusing on weak areas")
-            mentoring_plan.append("Monthly progress assessments with detailed feedback")
-        elif previous_scores < 75:
-            recommendations.append({
-                "category": "📈 Performance Boost",
-                "priority": "MEDIUM",
-                "message": "You're on the right track! Let's optimize your approach",
-                "action": "1. Practice advanced problem-solving\n2. Join study groups\n3. Teach concepts to others (Feynman Technique)",
-                "impact": "+15-20 points potential"
-            })
-            mentoring_plan.append("Weekly peer study group facilitation")
-        else:
-            insights.append("🌟 Outstanding previous performance! Focus on maintaining excellence.")
-        
-        # Sleep Analysis
-        if sleep_hours < 6:
-            recommendations.append({
-                "category": "😴 Sleep & Wellness",
-                "priority": "HIGH",
-                "message": "Insufficient sleep significantly impacts learning and memory",
-                "action": "1. Aim for 7-8 hours of sleep\n2. Establish a bedtime routine\n3. Avoid screens 1 hour before bed",
-                "impact": "+10-15 points potential"
-            })
-            insights.append("⚠️ Sleep deprivation reduces cognitive function by up to 40%")
-        elif sleep_hours > 9:
-            recommendations.append({
-                "category": "😴 Sleep Optimization",
-                "priority": "LOW",
-                "message": "Consider optimizing sleep duration",
-                "action": "7-8 hours is optimal for most students. Extra sleep may indicate other issues.",
-                "impact": "+5 points potential"
-            })
-        else:
-            insights.append("✅ Perfect sleep schedule for optimal learning!")
-        
-        # Sample Papers Analysis
-        if sample_papers < 3:
-            recommendations.append({
-                "category": "📝 Practice & Testing",
-                "priority": "HIGH",
-                "message": "Increase practice with sample papers and mock tests",
-                "action": "1. Solve 2-3 sample papers weekly\n2. Analyze mistakes thoroughly\n3. Time yourself to build exam stamina",
-                "impact": "+15-20 points potential"
-            })
-            mentoring_plan.append("Weekly mock test sessions with detailed performance analysis")
-        elif sample_papers < 6:
-            recommendations.append({
-                "category": "📝 Practice Enhancement",
-                "priority": "MEDIUM",
-                "message": "Good practice! Let's make it more strategic",
-                "action": "Focus on previous year papers and challenging questions",
-                "impact": "+10 points potential"
-            })
-        else:
-            insights.append("🎯 Excellent practice routine! You're exam-ready!")
-        
-        # Extracurricular Balance
-        if extracurricular == 0:
-            recommendations.append({
-                "category": "⚖️ Life Balance",
-                "priority": "MEDIUM",
-                "message": "Consider adding extracurricular activities",
-                "action": "1. Join 1-2 activities you enjoy\n2. Improves stress management\n3. Enhances overall cognitive function",
-                "impact": "+5-10 points potential"
-            })
-        else:
-            insights.append("🎨 Great balance between academics and activities!")
-        
-        # Predicted Score Based Recommendations
-        if predicted_score < 50:
-            recommendations.append({
-                "category": "🎯 Intensive Improvement Plan",
-                "priority": "CRITICAL",
-                "message": "Comprehensive support needed",
-                "action": "1. Daily structured study plan\n2. Professional tutoring 3x/week\n3. Weekly progress monitoring\n4. Identify and address learning gaps",
-                "impact": "+25-35 points potential"
-            })
-            mentoring_plan.append("Daily check-ins via messaging app")
-            mentoring_plan.append("Parent-teacher meetings every 2 weeks")
-        elif predicted_score < 70:
-            recommendations.append({
-                "category": "🎯 Strategic Improvement",
-                "priority": "HIGH",
-                "message": "Focus on targeted improvements",
-                "action": "1. Identify top 3 weak areas\n2. Dedicated practice sessions\n3. Regular self-assessment",
-                "impact": "+15-25 points potential"
-            })
-            mentoring_plan.append("Bi-weekly mentoring sessions")
-        elif predicted_score < 85:
-            insights.append("💪 Strong performance! Fine-tune your strategies for excellence.")
-            mentoring_plan.append("Monthly strategy optimization sessions")
-        else:
-            insights.append("🏆 Outstanding prediction! You're on track for exceptional results!")
-            mentoring_plan.append("Quarterly advanced learning sessions")
-        
-        return recommendations, insights, mentoring_plan
-    
-    @staticmethod
-    def get_study_techniques():
-        return {
-            "Active Recall": "Test yourself frequently instead of passive re-reading",
-            "Spaced Repetition": "Review material at increasing intervals over time",
-            "Feynman Technique": "Explain concepts in simple terms to identify gaps",
-            "Pomodoro Method": "25-min focused study + 5-min break cycles",
-            "Mind Mapping": "Visual organization of concepts and relationships",
-            "Interleaving": "Mix different subjects/topics in study sessions",
-            "Practice Testing": "Regular mock exams under timed conditions",
-            "Elaborative Interrogation": "Ask 'why' and 'how' for deeper understanding"
-        }
+    predictor = loaded_model.predictor if loaded_model else None
+    prediction_table = load_prediction_table(tenant, loaded_model.version, loaded_model) if predictor and TABLE_MODE else None
 
 # Header
 st.title("🎓 AI-Powered Student Performance Analyzer")
@@ -275,31 +168,124 @@ with st.sidebar:
     st.markdown("---")
     analyze_button = st.button("🚀 Analyze Performance", type="primary", use_container_width=True)
 
-if model and scaler:
-    # Prepare input data
-    extracurricular_encoded = 1 if extracurricular_activities == 'Yes' else 0
+def compute_summary(hours_studied, previous_scores, extracurricular_encoded, sleep_hours, sample_papers):
+    """Prediction and advice for one set of inputs."""
+    with profiler.stage('predict'):
+        if prediction_table is not None:
+            prediction, _ = prediction_table.lookup(
+                hours_studied, previous_scores, extracurricular_encoded,
+                sleep_hours, sample_papers
+            )
+        else:
+            prediction, _ = model_pool.predict_one(
+                tenant, hours_studied, previous_scores, extracurricular_encoded,
+                sleep_hours, sample_papers
+            )
     
-    input_data = {
-        'Hours Studied': hours_studied,
-        'Previous Scores': previous_scores,
-        'Extracurricular Activities': extracurricular_encoded,
-        'Sleep Hours': sleep_hours,
-        'Sample Question Papers Practiced': sample_papers
+    with profiler.stage('recommendations'):
+        recommendations, insights, mentoring_plan = StudyAdvisor.get_study_recommendations(
+            hours_studied, previous_scores, extracurricular_encoded, 
+            sleep_hours, sample_papers, prediction
+        )
+        sort_by_priority(recommendations)
+    
+    return {
+        'prediction': prediction,
+        'recommendations': tuple(recommendations),
+        'insights': tuple(insights),
+        'mentoring_plan': tuple(mentoring_plan),
     }
+
+def compute_charts(hours_studied, previous_scores, extracurricular_encoded, sleep_hours, sample_papers, prediction):
+    # Plotly is only imported once the metrics row is already on screen
+    from dashboard_charts import gauge_chart, radar_chart
     
-    input_df = pd.DataFrame(input_data, index=[0])
+    with profiler.stage('charts'):
+        return {
+            'radar': radar_chart(hours_studied, previous_scores, sample_papers, sleep_hours, extracurricular_encoded),
+            'gauge': gauge_chart(prediction, previous_scores),
+        }
+
+def compute_roadmap(hours_studied, previous_scores, extracurricular_encoded, sleep_hours, sample_papers, prediction):
+    """Week-by-week steps along the Pareto frontier of real predicted gains."""
+    from dashboard_charts import roadmap_chart
+    from what_if import roadmap, sweep
     
-    # Scale numerical features
-    numerical_cols = ['Hours Studied', 'Previous Scores', 'Sleep Hours', 'Sample Question Papers Practiced']
-    input_scaled = input_df.copy()
-    input_scaled[numerical_cols] = scaler.transform(input_df[numerical_cols])
+    with profiler.stage('what_if'):
+        _, plans = sweep(predictor, hours_studied, previous_scores, extracurricular_encoded,
+                         sleep_hours, sample_papers)
+        projected_scores, weekly_plans = roadmap(prediction, plans)
     
-    # Make prediction
-    prediction = model.predict(input_scaled)[0]
+    return {
+        'plans': tuple(plans),
+        'projected_scores': projected_scores,
+        'weekly_plans': tuple(weekly_plans),
+        'chart': roadmap_chart(projected_scores),
+    }
+
+def cached_section(inputs, name, compute):
+    """One part of the result bundle for these inputs, shared by all sessions via RESULTS."""
+    with profiler.stage('results'):
+        return RESULTS.get_or_compute(inputs + (name,), (loaded_model.version, TABLE_MODE), compute, scope=tenant)
+
+@st.fragment
+def secondary_sections(inputs, prediction, mentoring_plan):
+    """Below-the-fold sections, rendered only when picked; switching reruns just this fragment."""
+    st.markdown("---")
+    section = st.segmented_control(
+        "📂 More for you",
+        ["👨‍🏫 Mentoring Plan", "🧠 Study Techniques", "📅 30-Day Roadmap"],
+        key='secondary_section'
+    )
+    
+    if section == "👨‍🏫 Mentoring Plan":
+        st.markdown("### 👨‍🏫 Personalized Mentoring Plan")
+        
+        if mentoring_plan:
+            for i, plan in enumerate(mentoring_plan, 1):
+                st.markdown(f"{i}. {plan}")
+        else:
+            st.info("Continue your excellent self-directed learning approach!")
+    
+    elif section == "🧠 Study Techniques":
+        st.markdown("### 🧠 Proven Study Techniques")
+        
+        techniques = StudyAdvisor.get_study_techniques()
+        
+        cols = st.columns(2)
+        for idx, (technique, description) in enumerate(techniques.items()):
+            with cols[idx % 2]:
+                st.markdown(f"**{technique}**")
+                st.caption(description)
+    
+    elif section == "📅 30-Day Roadmap":
+        from what_if import describe
+        
+        st.markdown("### 📅 30-Day Improvement Roadmap")
+        
+        road = cached_section(inputs, 'roadmap', lambda: compute_roadmap(*inputs, prediction))
+        
+        with profiler.stage('chart_roadmap'):
+            st.plotly_chart(road['chart'], use_container_width=True)
+        
+        if road['plans']:
+            for week, (score, plan) in enumerate(zip(road['projected_scores'], road['weekly_plans']), 1):
+                if plan:
+                    st.markdown(f"**Week {week}:** {describe(plan)} → {score:.1f}% ({plan['gain']:+.1f})")
+        else:
+            st.info("You are already at the limit of what these habits can add — keep it up!")
+
+if predictor:
+    # Prepare input data
+    extracurricular_encoded = 1 if extracurricular_activities == 'Yes' else 0
+    inputs = normalize_inputs(hours_studied, previous_scores, extracurricular_encoded, sleep_hours, sample_papers)
+    
+    summary = cached_section(inputs, 'summary', lambda: compute_summary(*inputs))
+    prediction = summary['prediction']
     
     # Main dashboard
     if analyze_button or True:  # Auto-analyze on load
-        # Top metrics
+        # Top metrics, painted before anything heavier is imported or built
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
@@ -308,8 +294,7 @@ if model and scaler:
                      help="AI-predicted performance index")
         
         with col2:
-            performance_level = "Excellent" if prediction >= 85 else "Good" if prediction >= 70 else "Average" if prediction >= 50 else "Needs Improvement"
-            st.metric("📊 Performance Level", performance_level)
+            st.metric("📊 Performance Level", performance_level(prediction))
         
         with col3:
             potential_improvement = max(0, 95 - prediction)
@@ -321,88 +306,29 @@ if model and scaler:
             st.metric("⚡ Study Efficiency", f"{study_efficiency:.1f}/10",
                      help="Output per hour of study")
         
+        profiler.mark('first_paint')
         st.markdown("---")
         
         # Visualization section
+        charts = cached_section(inputs, 'charts', lambda: compute_charts(*inputs, prediction))
         col1, col2 = st.columns(2)
         
         with col1:
             # Radar chart for skill analysis
-            categories = ['Study Hours', 'Previous Performance', 'Practice Tests', 'Sleep Quality', 'Life Balance']
-            values = [
-                (hours_studied / 10) * 100,
-                previous_scores,
-                (sample_papers / 10) * 100,
-                (sleep_hours / 12) * 100,
-                extracurricular_encoded * 100
-            ]
-            
-            fig = go.Figure(data=go.Scatterpolar(
-                r=values + [values[0]],
-                theta=categories + [categories[0]],
-                fill='toself',
-                fillcolor='rgba(0, 0, 0, 0.15)', 
-                marker=dict(color='black', size=8),
-                line=dict(color='black', width=3)
-            ))
-            
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(visible=True, range=[0, 100], showticklabels=True, ticks='', tickfont=dict(color="black"), gridcolor='black'),
-                    angularaxis=dict(tickfont=dict(color="black"), gridcolor='black'),
-                    bgcolor='rgba(255, 255, 255, 0.6)'
-                ),
-                showlegend=False,
-                title="Your Performance Profile",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='black', size=12),
-                height=400
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            with profiler.stage('chart_radar'):
+                st.plotly_chart(charts['radar'], use_container_width=True)
         
         with col2:
             # Score comparison gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number+delta",
-                value=prediction,
-                number={'font':{'color':'black','size': 44}},
-                delta={'reference': previous_scores, 'increasing': {'color': "green"}},
-                title={'text': "Performance Index", 'font': {'color': 'black', 'size': 20}},
-                gauge={
-                    'axis': {'range': [None, 100], 'tickcolor': 'black'},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 50], 'color': 'rgba(255, 99, 71, 0.3)'},
-                        {'range': [50, 70], 'color': 'rgba(255, 215, 0, 0.3)'},
-                        {'range': [70, 85], 'color': 'rgba(50, 205, 50, 0.3)'},
-                        {'range': [85, 100], 'color': 'rgba(0, 128, 0, 0.3)'}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 85
-                    }
-                }
-            ))
-            
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                font={'color': "black", 'family': "Arial"},
-                height=400
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            with profiler.stage('chart_gauge'):
+                st.plotly_chart(charts['gauge'], use_container_width=True)
         
         # AI Recommendations Section
         st.markdown("---")
         st.markdown("## 🤖 AI-Powered Recommendations")
         
-        recommendations, insights, mentoring_plan = StudyAdvisor.get_study_recommendations(
-            hours_studied, previous_scores, extracurricular_encoded, 
-            sleep_hours, sample_papers, prediction
-        )
+        insights = summary['insights']
+        recommendations = summary['recommendations']
         
         # Display insights
         if insights:
@@ -410,14 +336,10 @@ if model and scaler:
             for insight in insights:
                 st.markdown(f'<div class="insight-box">{insight}</div>', unsafe_allow_html=True)
         
-        # Display recommendations
+        # Display recommendations (already sorted by priority)
         if recommendations:
             st.markdown("### 🎯 Personalized Action Plan")
             
-            # Sort by priority
-            priority_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-            recommendations.sort(key=lambda x: priority_order.get(x['priority'], 4))
-            
             for rec in recommendations:
                 priority_color = {
                     "CRITICAL": "🔴",
@@ -432,68 +354,8 @@ if model and scaler:
                     st.info(rec['action'])
                     st.success(f"**Expected Impact:** {rec['impact']}")
         
-        # Mentoring Plan
-        st.markdown("---")
-        st.markdown("### 👨‍🏫 Personalized Mentoring Plan")
-        
-        if mentoring_plan:
-            for i, plan in enumerate(mentoring_plan, 1):
-                st.markdown(f"{i}. {plan}")
-        else:
-            st.info("Continue your excellent self-directed learning approach!")
-        
-        # Study Techniques
-        st.markdown("---")
-        st.markdown("### 🧠 Proven Study Techniques")
-        
-        techniques = StudyAdvisor.get_study_techniques()
-        
-        cols = st.columns(2)
-        for idx, (technique, description) in enumerate(techniques.items()):
-            with cols[idx % 2]:
-                st.markdown(f"**{technique}**")
-                st.caption(description)
-        
-        # Progress Tracking
-        st.markdown("---")
-        st.markdown("### 📅 30-Day Improvement Roadmap")
-        
-        weeks = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
-        projected_scores = [
-            prediction,
-            min(100, prediction + 5),
-            min(100, prediction + 12),
-            min(100, prediction + 20)
-        ]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=weeks, y=projected_scores,
-            mode='lines+markers',
-            name='Projected Progress',
-            line=dict(color='#00f2fe', width=4),
-            marker=dict(size=12, color='#4facfe')
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=weeks, y=[85]*4,
-            mode='lines',
-            name='Excellence Target',
-            line=dict(color='green', width=2, dash='dash')
-        ))
-        
-        fig.update_layout(
-            title="Your Growth Trajectory",
-            xaxis_title="Timeline",
-            yaxis_title="Performance Score",
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(255,255,255,0.1)',
-            font=dict(color='white'),
-            height=400,
-            hovermode='x unified'
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        # Mentoring plan, study techniques and roadmap on demand
+        secondary_sections(inputs, prediction, summary['mentoring_plan'])
         
         # Footer
         st.markdown("---")
@@ -503,7 +365,23 @@ if model and scaler:
             <p style='font-size: 12px; opacity: 0.7;'>Last Updated: {}</p>
         </div>
         """.format(datetime.now().strftime("%B %d, %Y at %H:%M")), unsafe_allow_html=True)
+        
+        # Drift monitors are built after the page is painted, once per process
+        drift_monitor = load_drift_monitors().get(tenant, loaded_model)
+        # Reloads, the Analyze button and tenant switches rerun with unchanged inputs
+        if st.session_state.get('drift_recorded_inputs') != inputs:
+            drift_monitor.record(inputs, prediction)
+            st.session_state['drift_recorded_inputs'] = inputs
 
 else:
+    drift_monitor = None
     st.error("Unable to load the model. Please check if model files exist in the directory.")
     st.info("Required files: linear_regression_model.pkl, scaler.pkl")
+
+# Admin profiling panel, only shown when instrumentation is enabled
+profiler.finish()
+if profiler.enabled:
+    pool_stats = model_pool.stats()
+    render_admin_panel(st, profiler, caches={'results': RESULTS.stats()}, tenants=pool_stats['tenants'])
+    if drift_monitor is not None:
+        render_drift_panel(st, drift_monitor, f"{tenant} {loaded_model.version}")
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch_score import encode_features
+from predictor import FEATURE_COLS
+
+
+@pytest.mark.parametrize('dtype', [object, 'string', pd.StringDtype(na_value=np.nan)])
+def test_yes_no_encoded_for_any_string_dtype(dtype):
+    chunk = pd.DataFrame([[7, 99, 'Yes', 9, 1], [4, 82, 'No', 4, 2]], columns=FEATURE_COLS)
+    chunk['Extracurricular Activities'] = chunk['Extracurricular Activities'].astype(dtype)
+    X = encode_features(chunk)
+    assert X[:, FEATURE_COLS.index('Extracurricular Activities')].tolist() == [1.0, 0.0]
+
+
+def test_unknown_label_rejected():
+    chunk = pd.DataFrame([[7, 99, 'Maybe', 9, 1]], columns=FEATURE_COLS)
+    with pytest.raises(ValueError):
+        encode_features(chunk)
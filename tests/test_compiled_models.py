@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import compiled_models
+from batch_score import encode_features
+from model_artifact import compile_model
+from predictor import FEATURE_COLS, NUMERICAL_COLS
+
+
+@pytest.fixture(scope='module')
+def training():
+    from train import prepare_data
+
+    df = pd.read_csv('Student_Performance.csv')
+    arrays, scaler = prepare_data(df)
+    return pd.DataFrame(arrays['X_train'], columns=FEATURE_COLS), arrays['y_train'], scaler, encode_features(df)
+
+
+@pytest.fixture(scope='module')
+def inputs(training):
+    rng = np.random.default_rng(0)
+    X = training[3]
+    off_grid = np.column_stack([rng.uniform(-2, 12, 2000), rng.uniform(-10, 110, 2000), rng.integers(0, 2, 2000),
+                                rng.uniform(-2, 14, 2000), rng.uniform(-2, 12, 2000)])
+    return np.vstack([X, off_grid, [[0, 0, 0, 0, 0], [10, 100, 1, 12, 10], [1e6, -1e6, 1, 1e30, -3]]])
+
+
+def _sklearn_predict(model, scaler, X):
+    frame = pd.DataFrame(X, columns=FEATURE_COLS)
+    frame[NUMERICAL_COLS] = scaler.transform(frame[NUMERICAL_COLS])
+    return model.predict(frame)
+
+
+def _models():
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.neighbors import KNeighborsRegressor
+    from sklearn.tree import DecisionTreeRegressor
+
+    return {
+        'tree': DecisionTreeRegressor(random_state=42),
+        'forest': RandomForestRegressor(n_estimators=20, random_state=42, n_jobs=1),
+        'knn': KNeighborsRegressor(),
+    }
+
+
+@pytest.fixture(scope='module', params=list(_models()))
+def fitted(request, training):
+    X_train, y_train, scaler, _ = training
+    return _models()[request.param].fit(X_train, y_train), scaler
+
+
+def test_compiled_predictions_are_bit_identical(fitted, inputs):
+    model, scaler = fitted
+    predictor = compile_model(model, scaler)
+    expected = _sklearn_predict(model, scaler, inputs)
+    assert np.array_equal(predictor.predict(inputs), expected)
+    sample = np.random.default_rng(1).choice(len(inputs), 300, replace=False)
+    assert [predictor.predict_one(*inputs[i].tolist()) for i in sample] == expected[sample].tolist()
+
+
+def test_trees_without_cell_table_are_bit_identical(training, inputs, monkeypatch):
+    X_train, y_train, scaler, _ = training
+    model = _models()['forest'].fit(X_train, y_train)
+    monkeypatch.setattr(compiled_models, 'MAX_TABLE_CELLS', 0)
+    predictor = compile_model(model, scaler)
+    assert predictor.table is None
+    expected = _sklearn_predict(model, scaler, inputs)
+    assert np.array_equal(predictor.predict(inputs), expected)
+    assert predictor.predict_one(*inputs[0].tolist()) == expected[0]
@@ -0,0 +1,30 @@
+import json
+import math
+
+import numpy as np
+
+from drift_monitor import MONITORED_COLS, DriftMonitor, Reference, StreamingSummary
+
+
+def _reference():
+    return Reference('test', {col: 5.0 for col in MONITORED_COLS}, {col: 2.0 for col in MONITORED_COLS})
+
+
+def test_non_finite_rows_are_skipped():
+    summary = StreamingSummary().update([[5, 70, 1, 7, 3, 60], [np.nan, 70, 1, 7, 3, 60], [5, 70, 1, 7, 3, np.inf]])
+    assert summary.n == 1
+    assert summary.skipped == 2
+    assert np.isfinite(summary.mean).all() and np.isfinite(summary.m2).all()
+
+
+def test_nan_prediction_does_not_poison_the_report():
+    monitor = DriftMonitor(_reference(), window_size=10)
+    monitor.record([5, 70, 1, 7, 3], float('nan'))
+    monitor.record_batch(np.full((20, 5), 5.0), np.full(20, 60.0))
+    report = monitor.report()
+    assert report['rows'] == 20
+    assert report['skipped_rows'] == 1
+    for scores in report['overall'].values():
+        assert math.isfinite(scores['live_mean'])
+        assert scores['mean_shift'] is not None
+    json.dumps(report, allow_nan=False)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch_score import encode_features
+from incremental import TARGET_COL, IncrementalTrainer
+from predictor import FEATURE_COLS, NUMERICAL_COLS
+
+
+@pytest.fixture(scope='module')
+def data():
+    df = pd.read_csv('Student_Performance.csv')
+    return encode_features(df), df[TARGET_COL].to_numpy(dtype=np.float64)
+
+
+def _scaled(X, scaler):
+    frame = pd.DataFrame(X, columns=FEATURE_COLS)
+    frame[NUMERICAL_COLS] = scaler.transform(frame[NUMERICAL_COLS])
+    return frame
+
+
+def test_streaming_updates_match_full_refit(data):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
+
+    X, y = data
+    trainer = IncrementalTrainer()
+    for start in range(0, len(X), 777):
+        trainer.partial_fit(X[start:start + 777], y[start:start + 777])
+    scaler = StandardScaler().fit(pd.DataFrame(X, columns=FEATURE_COLS)[NUMERICAL_COLS])
+    model = LinearRegression().fit(_scaled(X, scaler), y)
+    coef, intercept = trainer.solve()
+    mean, var, _ = trainer.scaler_params()
+
+    assert trainer.n == len(X)
+    np.testing.assert_allclose(mean, scaler.mean_, rtol=1e-12)
+    np.testing.assert_allclose(var, scaler.var_, rtol=1e-10)
+    np.testing.assert_allclose(coef, model.coef_, rtol=1e-10)
+    assert intercept == pytest.approx(model.intercept_, rel=1e-12)
+    np.testing.assert_allclose(trainer.to_predictor().predict(X), model.predict(_scaled(X, scaler)), rtol=0, atol=1e-9)
+
+
+def test_merged_shards_match_single_pass(data):
+    X, y = data
+    single = IncrementalTrainer().partial_fit(X, y)
+    shards = [IncrementalTrainer().partial_fit(X[i::3], y[i::3]) for i in range(3)]
+    merged = shards[0].merge(shards[1]).merge(shards[2])
+    assert merged.n == single.n
+    np.testing.assert_allclose(merged.mean, single.mean, rtol=1e-12)
+    np.testing.assert_allclose(merged.m2, single.m2, rtol=1e-10)
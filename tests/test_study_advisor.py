@@ -0,0 +1,23 @@
+import numpy as np
+
+from study_advisor import RULES, StudyAdvisor, sort_by_priority
+
+
+def test_batch_advice_matches_per_student_rules():
+    rng = np.random.default_rng(0)
+    n = 5000
+    score_edges = [t for column, thresholds, _ in RULES if column == 5 for t, _ in thresholds]
+    # Integers cover every band edge of the sliders; the halves fall between them
+    columns = [
+        rng.integers(0, 21, n) / 2,
+        rng.integers(0, 201, n) / 2,
+        rng.integers(0, 2, n),
+        rng.integers(0, 25, n) / 2,
+        rng.integers(0, 21, n) / 2,
+        np.concatenate([rng.uniform(0, 100, n - len(score_edges)), score_edges]),
+    ]
+    advice = StudyAdvisor.get_batch_recommendations(*columns)
+    assert len(advice) == n
+    for i, row in enumerate(zip(*(c.tolist() for c in columns))):
+        recommendations, insights, mentoring_plan = StudyAdvisor.get_study_recommendations(*row)
+        assert advice.expand(i) == (sort_by_priority(recommendations), insights, mentoring_plan)
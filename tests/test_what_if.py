@@ -0,0 +1,19 @@
+import pytest
+
+from model_artifact import load_artifact
+from what_if import sweep
+
+
+@pytest.fixture(scope='module')
+def predictor():
+    return load_artifact('linear_regression_model.json')
+
+
+@pytest.mark.parametrize('sleep_hours', [10, 11, 12])
+def test_high_sleep_still_gets_plans(predictor, sleep_hours):
+    _, plans = sweep(predictor, 5, 70, 0, sleep_hours, 3)
+    assert plans
+    # Sleep above the old 9 h cap no longer forces every plan to cut it
+    assert any(plan['changes']['Sleep Hours'] >= 0 for plan in plans)
+    for plan in plans:
+        assert 0 <= sleep_hours + plan['changes']['Sleep Hours'] <= 12
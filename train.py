@@ -0,0 +1,258 @@
+"""Parallel model selection for the student performance model.
+
+Usage:
+    python train.py --data Student_Performance.csv --folds 5 --jobs 8
+
+Runs the notebook's candidate regressors (holdout fit plus k-fold
+cross-validation) across a process pool. The scaled train/test arrays are
+placed in shared memory once and attached by every worker, so they are not
+copied per task. Each fit runs in a freshly forked worker, so the growth
+of that worker's peak RSS is the fit's own memory, including the trees
+and neighbour indexes scikit-learn allocates outside the Python heap. The best model and its scaler are written to --output-dir
+and, with --publish, added to the model registry as the active version.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import pickle
+import resource
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from predictor import EXTRACURRICULAR_MAP, FEATURE_COLS, NUMERICAL_COLS
+
+TARGET_COL = 'Performance Index'
+
+
+def make_models():
+    """Fresh instances of the notebook's candidate regressors."""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import ElasticNet, Lasso, LinearRegression, Ridge
+    from sklearn.neighbors import KNeighborsRegressor
+    from sklearn.tree import DecisionTreeRegressor
+
+    return {
+        "Linear Regression": LinearRegression(),
+        "Lasso": Lasso(),
+        "Ridge": Ridge(),
+        "Elasticnet": ElasticNet(),
+        "K-Neighbors Regressor": KNeighborsRegressor(),
+        "Decision Tree": DecisionTreeRegressor(random_state=42),
+        # One core per fit; the pool already spreads fits across cores
+        "Random Forest Regressor": RandomForestRegressor(random_state=42, n_jobs=1),
+    }
+
+
+def calculate_model_metrics(true, predicted):
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    mae = mean_absolute_error(true, predicted)
+    rmse = np.sqrt(mean_squared_error(true, predicted))
+    r2_square = r2_score(true, predicted)
+    return mae, rmse, r2_square
+
+
+def prepare_data(df, test_size=0.25, random_state=42):
+    """Split, encode and scale the data the same way as student.ipynb."""
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    X = df[FEATURE_COLS].copy()
+    y = df[TARGET_COL]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+
+    if not pd.api.types.is_numeric_dtype(X_train['Extracurricular Activities']):
+        X_train['Extracurricular Activities'] = X_train['Extracurricular Activities'].map(EXTRACURRICULAR_MAP)
+        X_test['Extracurricular Activities'] = X_test['Extracurricular Activities'].map(EXTRACURRICULAR_MAP)
+
+    scaler = StandardScaler()
+    X_train[NUMERICAL_COLS] = scaler.fit_transform(X_train[NUMERICAL_COLS])
+    X_test[NUMERICAL_COLS] = scaler.transform(X_test[NUMERICAL_COLS])
+
+    arrays = {
+        'X_train': X_train.to_numpy(dtype=np.float64),
+        'X_test': X_test.to_numpy(dtype=np.float64),
+        'y_train': y_train.to_numpy(dtype=np.float64),
+        'y_test': y_test.to_numpy(dtype=np.float64),
+    }
+    return arrays, scaler
+
+
+class SharedArrays:
+    """Named float64 arrays published to shared memory for pool workers."""
+
+    def __init__(self, arrays):
+        self.blocks = {}
+        self.specs = {}
+        for name, array in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            self.blocks[name] = block
+            self.specs[name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self):
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+
+
+# Per-worker views onto the shared arrays, set up once by _attach()
+_worker_arrays = {}
+_worker_blocks = []
+
+
+def _attach(specs):
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        _worker_arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _frame(X):
+    return pd.DataFrame(X, columns=FEATURE_COLS, copy=False)
+
+
+def _run_task(model_name, fold, train_idx, valid_idx):
+    """Fit one candidate on one split; fold is None for the holdout fit."""
+    model = make_models()[model_name]
+    X_train, y_train = _worker_arrays['X_train'], _worker_arrays['y_train']
+    if fold is None:
+        X_fit, y_fit = X_train, y_train
+        X_eval, y_eval = _worker_arrays['X_test'], _worker_arrays['y_test']
+    else:
+        X_fit, y_fit = X_train[train_idx], y_train[train_idx]
+        X_eval, y_eval = X_train[valid_idx], y_train[valid_idx]
+
+    # ru_maxrss of a forked child starts at its own RSS, so growth during the fit is the fit's peak
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    model.fit(_frame(X_fit), y_fit)
+    predicted = model.predict(_frame(X_eval))
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    mae, rmse, r2 = calculate_model_metrics(y_eval, predicted)
+    result = {
+        'model': model_name,
+        'fold': fold,
+        'mae': mae,
+        'rmse': rmse,
+        'r2': r2,
+        'seconds': seconds,
+        'peak_mb': (peak - baseline) / 1024,
+    }
+    return result, model if fold is None else None
+
+
+def _run_packed(task):
+    return _run_task(*task)
+
+
+def select_model(df, folds=5, jobs=None, candidates=None, random_state=42):
+    """Evaluate candidates in parallel; returns (report, best_model, scaler)."""
+    from sklearn.model_selection import KFold
+
+    arrays, scaler = prepare_data(df, random_state=random_state)
+    models = make_models()  # imports the estimators before workers are forked
+    names = candidates or list(models)
+    splits = list(KFold(n_splits=folds, shuffle=True, random_state=random_state).split(arrays['X_train'])) if folds > 1 else []
+
+    shared = SharedArrays(arrays)
+    results = {name: {'cv': []} for name in names}
+    fitted = {}
+    start = time.perf_counter()
+    try:
+        tasks = [(name, None, None, None) for name in names]
+        tasks += [(name, k, train_idx, valid_idx) for name in names for k, (train_idx, valid_idx) in enumerate(splits)]
+        # One task per forked worker (cheap: the parent already imported scikit-learn) for per-fit RSS
+        context = multiprocessing.get_context('fork')
+        with context.Pool(jobs or os.cpu_count(), _attach, (shared.specs,), maxtasksperchild=1) as pool:
+            for result, model in pool.imap_unordered(_run_packed, tasks, chunksize=1):
+                entry = results[result['model']]
+                if result['fold'] is None:
+                    entry['holdout'] = result
+                    fitted[result['model']] = model
+                else:
+                    entry['cv'].append(result)
+    finally:
+        shared.close()
+
+    for name, entry in results.items():
+        entry['cv'].sort(key=lambda r: r['fold'])
+        entry['cv_r2_mean'] = float(np.mean([r['r2'] for r in entry['cv']])) if entry['cv'] else None
+        entry['total_seconds'] = entry['holdout']['seconds'] + sum(r['seconds'] for r in entry['cv'])
+        entry['peak_mb'] = max([entry['holdout']['peak_mb']] + [r['peak_mb'] for r in entry['cv']])
+
+    def score(name):
+        entry = results[name]
+        return entry['cv_r2_mean'] if entry['cv_r2_mean'] is not None else entry['holdout']['r2']
+
+    best = max(names, key=score)
+    report = {
+        'best_model': best,
+        'folds': folds,
+        'wall_seconds': time.perf_counter() - start,
+        'models': results,
+    }
+    return report, fitted[best], scaler
+
+
+def save_artifacts(output_dir, model, scaler, report):
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'model.pkl'), 'wb') as file:
+        pickle.dump(model, file)
+    with open(os.path.join(output_dir, 'scaler.pkl'), 'wb') as file:
+        pickle.dump(scaler, file)
+    with open(os.path.join(output_dir, 'metrics.json'), 'w') as file:
+        json.dump(report, file, indent=2)
+    if hasattr(model, 'coef_'):
+        from model_artifact import export_artifact
+        export_artifact(model, scaler, os.path.join(output_dir, 'model.json'))
+
+
+def print_report(report):
+    print(f"{'Model':<26}{'Test R2':>9}{'Test RMSE':>11}{'CV R2':>9}{'Fit s':>9}{'Peak MB':>9}")
+    for name, entry in report['models'].items():
+        holdout = entry['holdout']
+        cv = f"{entry['cv_r2_mean']:.4f}" if entry['cv_r2_mean'] is not None else '-'
+        print(f"{name:<26}{holdout['r2']:>9.4f}{holdout['rmse']:>11.4f}{cv:>9}"
+              f"{entry['total_seconds']:>9.2f}{entry['peak_mb']:>9.1f}")
+    print(f"Best model: {report['best_model']} (wall time {report['wall_seconds']:.2f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel model selection for the student performance model.")
+    parser.add_argument('--data', default='Student_Performance.csv')
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Parse --data directly instead of through the columnar dataset cache")
+    parser.add_argument('--folds', type=int, default=5, help="Cross-validation folds (1 disables CV)")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--models', nargs='+', default=None, help="Subset of candidate names to evaluate")
+    parser.add_argument('--output-dir', default='artifacts')
+    parser.add_argument('--publish', metavar='REGISTRY_DIR', default=None,
+                        help="Also publish the winner to this model registry and activate it")
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        df = pd.read_csv(args.data)
+    else:
+        from dataset import load_dataset
+        df = load_dataset(args.data).frame(encoded=True)
+    report, model, scaler = select_model(df, folds=args.folds, jobs=args.jobs, candidates=args.models)
+    print_report(report)
+    save_artifacts(args.output_dir, model, scaler, report)
+    print(f"Saved model, scaler and metrics to {args.output_dir}/")
+
+    if args.publish:
+        from model_registry import ModelRegistry
+        version = ModelRegistry(args.publish).publish(os.path.join(args.output_dir, 'model.pkl'),
+                                                      os.path.join(args.output_dir, 'scaler.pkl'))
+        print(f"Published {version} to {args.publish}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""What-if sweeps over the habits a student can change.
+
+For each student every reachable combination of hours studied, sleep
+hours and sample papers within the effort constraints is scored in one
+vectorized predictor call. The Pareto-optimal changes are kept: no other
+change gains more for the same or less effort. Cohorts are swept in
+fixed-size student chunks.
+"""
+import functools
+
+import numpy as np
+
+from predictor import FEATURE_COLS
+
+SWEEP_COLS = ('Hours Studied', 'Sleep Hours', 'Sample Question Papers Practiced')
+SWEEP_INDEX = [FEATURE_COLS.index(col) for col in SWEEP_COLS]
+SWEEP_LABELS = ('h study', 'h sleep', 'sample papers')
+BATCH_STUDENTS = 2048
+ROADMAP_WEEKS = 4
+
+
+class EffortConstraints:
+    """Limits on how far each habit may move, in SWEEP_COLS order.
+
+    max_step: largest change per habit in either direction.
+    bounds: allowed (low, high) value of each habit a plan changes; habits
+        it leaves alone may sit anywhere. Defaults match the sidebar sliders.
+    weights: effort cost per unit of change; a plan's effort is the
+        weighted sum of its absolute changes.
+    max_effort: optional cap on a plan's total effort.
+    """
+
+    def __init__(self, max_step=(3, 2, 4), bounds=((0, 10), (0, 12), (0, 10)),
+                 weights=(1.0, 0.5, 0.5), max_effort=None):
+        self.max_step = tuple(int(s) for s in max_step)
+        self.bounds = tuple(tuple(b) for b in bounds)
+        self.weights = tuple(float(w) for w in weights)
+        self.max_effort = max_effort
+
+    def _key(self):
+        return self.max_step, self.weights, self.max_effort
+
+    def grid(self):
+        """(deltas (K, 3), effort (K,), group starts) sorted by effort, no-op first."""
+        return _delta_grid(*self._key())
+
+
+DEFAULT_CONSTRAINTS = EffortConstraints()
+
+
+@functools.lru_cache(maxsize=32)
+def _delta_grid(max_step, weights, max_effort):
+    axes = [np.arange(-s, s + 1) for s in max_step]
+    deltas = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, len(max_step))
+    effort = np.abs(deltas) @ np.asarray(weights)
+    if max_effort is not None:
+        keep = effort <= max_effort
+        deltas, effort = deltas[keep], effort[keep]
+    order = np.argsort(effort, kind='stable')
+    deltas, effort = deltas[order], effort[order]
+    # Candidates with equal effort compete with each other for the frontier
+    starts = np.flatnonzero(np.r_[True, np.diff(effort) > 0])
+    for array in (deltas, effort, starts):
+        array.setflags(write=False)
+    return deltas, effort, starts
+
+
+def pareto_mask(gains, effort, starts):
+    """Frontier mask for gains (N, K) whose columns are sorted by effort.
+
+    A candidate is on the frontier if it is the best of its effort group
+    and beats every cheaper group. NaN (infeasible) gains never qualify.
+    """
+    gains = np.where(np.isnan(gains), -np.inf, gains)
+    sizes = np.diff(np.r_[starts, gains.shape[1]])
+    group_best = np.maximum.reduceat(gains, starts, axis=1)
+    cheaper_best = np.maximum.accumulate(group_best, axis=1)
+    cheaper_best = np.concatenate([np.full((len(gains), 1), -np.inf), cheaper_best[:, :-1]], axis=1)
+    return ((gains == np.repeat(group_best, sizes, axis=1))
+            & (gains > np.repeat(cheaper_best, sizes, axis=1))
+            & np.isfinite(gains))
+
+
+class BatchSweep:
+    """Sweep results for N students over K candidate changes."""
+
+    def __init__(self, baseline, gains, frontier, deltas, effort):
+        self.baseline = baseline
+        self.gains = gains
+        self.frontier = frontier
+        self.deltas = deltas
+        self.effort = effort
+
+    def plans(self, i):
+        """Frontier plans of student i, cheapest first, without the no-op."""
+        plans = []
+        for k in np.flatnonzero(self.frontier[i]):
+            if not self.effort[k]:
+                continue
+            plans.append({
+                'changes': dict(zip(SWEEP_COLS, self.deltas[k].tolist())),
+                'effort': float(self.effort[k]),
+                'score': float(self.baseline[i] + self.gains[i, k]),
+                'gain': float(self.gains[i, k]),
+            })
+        return plans
+
+    def best(self, max_effort=None):
+        """Index into the K candidates of each student's largest gain within max_effort."""
+        gains = np.where(np.isnan(self.gains), -np.inf, self.gains)
+        if max_effort is not None:
+            gains = np.where(self.effort <= max_effort, gains, -np.inf)
+        return gains.argmax(axis=1)
+
+
+def sweep_batch(predictor, X, constraints=DEFAULT_CONSTRAINTS, chunk_students=BATCH_STUDENTS):
+    """Score every candidate change for each row of X (N, 5 in FEATURE_COLS order)."""
+    X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+    deltas, effort, starts = constraints.grid()
+    low = np.array([b[0] for b in constraints.bounds], dtype=np.float64)
+    high = np.array([b[1] for b in constraints.bounds], dtype=np.float64)
+    n, k = len(X), len(deltas)
+
+    baseline = np.empty(n)
+    gains = np.empty((n, k))
+    for start in range(0, n, chunk_students):
+        block = X[start:start + chunk_students]
+        candidates = np.repeat(block[:, None, :], k, axis=1)
+        candidates[:, :, SWEEP_INDEX] += deltas
+        moved = candidates[:, :, SWEEP_INDEX]
+        # Only the habits a plan moves must land inside their bounds
+        feasible = ((moved >= low) & (moved <= high) | (deltas == 0)).all(axis=2)
+        scores = predictor.predict(candidates.reshape(-1, X.shape[1])).reshape(len(block), k)
+        baseline[start:start + len(block)] = scores[:, 0]
+        gains[start:start + len(block)] = np.where(feasible, scores - scores[:, :1], np.nan)
+
+    return BatchSweep(baseline, gains, pareto_mask(gains, effort, starts), deltas, effort)
+
+
+def sweep(predictor, hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers,
+          constraints=DEFAULT_CONSTRAINTS):
+    """(baseline score, frontier plans) for one student."""
+    result = sweep_batch(predictor, [[hours_studied, previous_scores, extracurricular, sleep_hours, sample_papers]],
+                         constraints)
+    return float(result.baseline[0]), result.plans(0)
+
+
+def roadmap(prediction, plans, weeks=ROADMAP_WEEKS):
+    """Weekly (scores, plans): week 1 is today, later weeks step up the frontier by effort."""
+    scores, chosen = [prediction], [None]
+    for week in range(1, weeks):
+        target = plans[-1]['effort'] * week / (weeks - 1) if plans else 0
+        affordable = [plan for plan in plans if plan['effort'] <= target]
+        plan = affordable[-1] if affordable else None
+        scores.append(min(100, prediction + plan['gain']) if plan else prediction)
+        chosen.append(plan)
+    return tuple(scores), chosen
+
+
+def describe(plan):
+    """Short text for a plan, e.g. '+2 h study, +1 sample papers'."""
+    parts = [f"{delta:+d} {label}" for label, delta in zip(SWEEP_LABELS, plan['changes'].values()) if delta]
+    return ', '.join(parts) or 'no change'